@@ -5,58 +5,357 @@ Handles SQLite database operations
 
 import sqlite3
 import os
+import threading
+import functools
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
+
+CLAIMS_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        entry_date TEXT NOT NULL,
+        admission_date TEXT NOT NULL,
+        customer_name TEXT NOT NULL,
+        policy_number TEXT NOT NULL,
+        hospital_name TEXT NOT NULL,
+        company_name TEXT NOT NULL,
+        claim_number TEXT,
+        claim_status TEXT NOT NULL,
+        claimed_amount REAL,
+        approved_amount REAL,
+        claim_type TEXT NOT NULL,
+        remark TEXT,
+        parent_claim_id INTEGER,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        tpa_name TEXT,
+        FOREIGN KEY (parent_claim_id) REFERENCES claims (id) ON DELETE CASCADE
+    )
+'''
+
+# Claims table plus the indexes used by searches, run as one script
+SCHEMA_SQL = CLAIMS_TABLE_SQL.format(table='claims') + ''';
+    CREATE INDEX IF NOT EXISTS idx_customer_name ON claims (customer_name COLLATE NOCASE);
+    CREATE INDEX IF NOT EXISTS idx_policy_number ON claims (policy_number COLLATE NOCASE);
+    CREATE INDEX IF NOT EXISTS idx_claim_status ON claims (claim_status);
+    CREATE INDEX IF NOT EXISTS idx_company_name ON claims (company_name);
+    CREATE INDEX IF NOT EXISTS idx_entry_date ON claims (entry_date);
+    -- Parent-claim picker filters on type and orders by entry date
+    CREATE INDEX IF NOT EXISTS idx_type_entry ON claims (claim_type, entry_date DESC, id DESC);
+    CREATE INDEX IF NOT EXISTS idx_parent ON claims (parent_claim_id);
+'''
+
+# Columns shown in claim lists; full rows are only loaded for editing and export
+LIST_COLUMNS = ("id, entry_date, admission_date, customer_name, policy_number, hospital_name, "
+                "company_name, claim_number, claim_status, claimed_amount, approved_amount, claim_type")
+
+# Display label for a parent claim, formatted by SQLite; {prefix} is an optional table alias
+CLAIM_LABEL_SQL = ("printf('%d - %s (%s)', {prefix}id, {prefix}customer_name, {prefix}policy_number) "
+                   "|| COALESCE(' - ' || NULLIF({prefix}claim_number, ''), '')")
+
+# Parent-claim picker columns, with the display label
+MAIN_CLAIM_COLUMNS = ("id, customer_name, policy_number, claim_number, claim_type, entry_date, admission_date, "
+                      + CLAIM_LABEL_SQL.format(prefix='') + " AS label")
+
+# Fixed queries, built once so every call passes the same SQL text to the statement cache
+ALL_CLAIMS_SQL = f"SELECT {LIST_COLUMNS} FROM claims ORDER BY entry_date DESC, id DESC"
+ALL_CLAIMS_FULL_SQL = "SELECT * FROM claims ORDER BY entry_date DESC, id DESC"
+LINKED_CLAIMS_SQL = f"SELECT {LIST_COLUMNS} FROM claims WHERE parent_claim_id = ?"
+CLAIM_WITH_LINKED_SQL = "SELECT * FROM claims WHERE id = ? OR parent_claim_id = ?"
+CLAIM_WITH_PARENT_SQL = f"""
+    SELECT c.*,
+           CASE WHEN p.id IS NOT NULL THEN {CLAIM_LABEL_SQL.format(prefix='p.')} END AS parent_label
+    FROM claims c
+    LEFT JOIN claims p ON c.parent_claim_id = p.id
+    WHERE c.id = ?
+"""
+
+@functools.lru_cache(maxsize=64)
+def _insert_sql(columns: Tuple[str, ...]) -> str:
+    """Build the INSERT statement for a column tuple"""
+    placeholders = ', '.join(['?' for _ in columns])
+    return f"INSERT INTO claims ({', '.join(columns)}) VALUES ({placeholders})"
+
+@functools.lru_cache(maxsize=64)
+def _update_sql(columns: Tuple[str, ...]) -> str:
+    """Build the UPDATE-by-id statement for a column tuple"""
+    set_clause = ', '.join([f"{key} = ?" for key in columns])
+    return f"UPDATE claims SET {set_clause} WHERE id = ?"
+
+# Search filters in WHERE-clause order: (filter key, SQL condition)
+SEARCH_CONDITIONS = (
+    ('customer_name', "customer_name LIKE ?"),
+    ('policy_number', "policy_number LIKE ?"),
+    ('claim_status', "claim_status = ?"),
+    ('claim_type', "claim_type = ?"),
+    ('company_name', "company_name = ?"),
+    ('entry_date_from', "entry_date >= ?"),
+    ('entry_date_to', "entry_date <= ?"),
+    ('admission_date_from', "admission_date >= ?"),
+    ('admission_date_to', "admission_date <= ?"),
+)
+
+MAIN_CLAIM_SEARCH_KEYS = ('customer_name', 'policy_number', 'admission_date_from', 'admission_date_to')
+
+# Filters matched as substrings rather than exact values
+LIKE_FILTERS = {'customer_name', 'policy_number'}
+
+# Equality filters that also accept a list/tuple of values, matched with IN (...)
+MULTI_VALUE_FILTERS = {'claim_status', 'claim_type', 'company_name'}
+
+# Substring conditions answered by the claims_fts trigram index when it is available
+FTS_CONDITIONS = {
+    'customer_name': "id IN (SELECT rowid FROM claims_fts WHERE customer_name LIKE ?)",
+    'policy_number': "id IN (SELECT rowid FROM claims_fts WHERE policy_number LIKE ?)",
+}
+
+# Columns search results may be ordered by (interpolated into ORDER BY, so whitelisted)
+SORTABLE_COLUMNS = frozenset(column.strip() for column in LIST_COLUMNS.split(','))
+
+# Columns mirrored into the full-text index
+FTS_COLUMNS = ('customer_name', 'policy_number', 'hospital_name', 'claim_number', 'remark')
+
+# Claim counts and amount totals per status, per company and overall ('totals', ''),
+# kept current by triggers on the claims table
+CLAIM_STATS_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS claim_stats (
+        kind TEXT NOT NULL,
+        name TEXT NOT NULL,
+        total INTEGER NOT NULL DEFAULT 0,
+        claimed REAL NOT NULL DEFAULT 0,
+        approved REAL NOT NULL DEFAULT 0,
+        PRIMARY KEY (kind, name)
+    )
+'''
+
+# Same figures computed from the claims table, used to fill claim_stats when it is first created
+CLAIM_STATS_REBUILD_SQL = '''
+    INSERT INTO claim_stats (kind, name, total, claimed, approved)
+    SELECT 'status', claim_status, COUNT(*), COALESCE(SUM(claimed_amount), 0), COALESCE(SUM(approved_amount), 0)
+    FROM claims GROUP BY claim_status
+    UNION ALL
+    SELECT 'company', company_name, COUNT(*), COALESCE(SUM(claimed_amount), 0), COALESCE(SUM(approved_amount), 0)
+    FROM claims GROUP BY company_name
+    UNION ALL
+    SELECT 'totals', '', COUNT(*), COALESCE(SUM(claimed_amount), 0), COALESCE(SUM(approved_amount), 0)
+    FROM claims
+'''
+
+def _claim_stats_delta_sql(row: str, sign: str) -> str:
+    """Trigger statement adding (sign '+') or removing (sign '-') the new/old claim row from claim_stats"""
+    counts = f"{sign}1, {sign}COALESCE({row}.claimed_amount, 0), {sign}COALESCE({row}.approved_amount, 0)"
+    return f"""
+        INSERT INTO claim_stats (kind, name, total, claimed, approved) VALUES
+            ('status', {row}.claim_status, {counts}),
+            ('company', {row}.company_name, {counts}),
+            ('totals', '', {counts})
+        ON CONFLICT (kind, name) DO UPDATE SET
+            total = total + excluded.total,
+            claimed = claimed + excluded.claimed,
+            approved = approved + excluded.approved;
+    """
+
+# Drops status/company rows whose last claim was removed, matching what GROUP BY would return
+CLAIM_STATS_PRUNE_SQL = "DELETE FROM claim_stats WHERE kind != 'totals' AND total <= 0;"
+
+def _active_conditions(filter_keys: frozenset, use_fts: bool, allowed_keys=None,
+                       multi_counts: Tuple[Tuple[str, int], ...] = ()) -> List[Tuple[str, str]]:
+    """Get (filter key, SQL condition) pairs for the active filters in WHERE-clause order"""
+    multi_counts = dict(multi_counts)
+    active = []
+    for key, condition in SEARCH_CONDITIONS:
+        if key not in filter_keys or (allowed_keys is not None and key not in allowed_keys):
+            continue
+        if use_fts and key in FTS_CONDITIONS:
+            condition = FTS_CONDITIONS[key]
+        elif key in multi_counts:
+            condition = f"{key} IN ({', '.join(['?'] * multi_counts[key])})"
+        active.append((key, condition))
+    return active
+
+def _filter_signature(filters: Dict) -> Tuple[frozenset, Tuple[Tuple[str, int], ...]]:
+    """Get the cache key for a filter dict: active keys plus the size of each multi-value filter"""
+    filter_keys = frozenset(k for k, v in filters.items() if v)
+    multi_counts = tuple(sorted((k, len(filters[k])) for k in filter_keys & MULTI_VALUE_FILTERS
+                                if isinstance(filters[k], (list, tuple))))
+    return filter_keys, multi_counts
+
+def _bind_values(filters: Dict, filter_keys: Tuple[str, ...], use_fts: bool) -> List:
+    """Get bound parameters for the filter keys, flattening multi-value filters"""
+    values = []
+    for key in filter_keys:
+        value = filters[key]
+        if key in MULTI_VALUE_FILTERS and isinstance(value, (list, tuple)):
+            values.extend(value)
+        else:
+            values.append(_search_value(key, value, use_fts))
+    return values
+
+@functools.lru_cache(maxsize=64)
+def _build_search_sql(filter_keys: frozenset, use_fts: bool = False, columns: str = LIST_COLUMNS,
+                      multi_counts: Tuple[Tuple[str, int], ...] = (), order_by: Optional[str] = None,
+                      desc: bool = False, paged: bool = False) -> Tuple[str, Tuple[str, ...]]:
+    """Build the search_claims query for a set of active filters
+    
+    Returns the parameterized SQL and the filter keys in placeholder order.
+    Paged queries end with LIMIT ? OFFSET ?, bound after the filter values.
+    """
+    active = _active_conditions(filter_keys, use_fts, multi_counts=multi_counts)
+    
+    query = f"SELECT {columns} FROM claims"
+    if active:
+        query += " WHERE " + " AND ".join(condition for _, condition in active)
+    if order_by:
+        direction = "DESC" if desc else "ASC"
+        query += f" ORDER BY {order_by} {direction}, id {direction}"
+    else:
+        query += " ORDER BY entry_date DESC, id DESC"
+    if paged:
+        query += " LIMIT ? OFFSET ?"
+    
+    return query, tuple(key for key, _ in active)
+
+@functools.lru_cache(maxsize=64)
+def _build_count_sql(filter_keys: frozenset, use_fts: bool = False,
+                     multi_counts: Tuple[Tuple[str, int], ...] = ()) -> Tuple[str, Tuple[str, ...]]:
+    """Build the COUNT(*) query matching _build_search_sql for a set of active filters"""
+    active = _active_conditions(filter_keys, use_fts, multi_counts=multi_counts)
+    
+    query = "SELECT COUNT(*) FROM claims"
+    if active:
+        query += " WHERE " + " AND ".join(condition for _, condition in active)
+    
+    return query, tuple(key for key, _ in active)
+
+@functools.lru_cache(maxsize=64)
+def _build_main_claims_sql(filter_keys: frozenset, use_fts: bool = False,
+                           multi_counts: Tuple[Tuple[str, int], ...] = ()) -> Tuple[str, Tuple[str, ...]]:
+    """Build the get_filtered_main_claims query for a set of active filters"""
+    active = _active_conditions(filter_keys, use_fts, MAIN_CLAIM_SEARCH_KEYS, multi_counts)
+    
+    where_conditions = ["claim_type IN ('Cashless', 'Reimbursement')"]
+    where_conditions.extend(condition for _, condition in active)
+    query = f"""
+                SELECT {MAIN_CLAIM_COLUMNS}
+                FROM claims 
+                WHERE {' AND '.join(where_conditions)}
+                ORDER BY entry_date DESC
+            """
+    
+    return query, tuple(key for key, _ in active)
+
+def _search_value(key: str, value, use_fts: bool = False):
+    """Convert a filter value into its bound query parameter
+    
+    Text filters are substring matches when the trigram index can serve them,
+    otherwise prefix matches so the NOCASE indexes are used instead of a scan.
+    """
+    if key in LIKE_FILTERS:
+        return f"%{value}%" if use_fts else f"{value}%"
+    return value
 
 class DatabaseManager:
+    # Per-connection tuning; journal_mode is persisted in the file and set in initialize_database
+    CONNECTION_PRAGMAS = """
+        PRAGMA foreign_keys = ON;
+        PRAGMA synchronous = NORMAL;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA mmap_size = 268435456;
+        PRAGMA cache_size = -64000;
+    """
+    
     def __init__(self, db_path: str = "insurance_claims.db"):
         """Initialize database manager with SQLite database"""
         self.db_path = db_path
+        # One cached connection per thread, tracked by thread id so close() can reach them all
+        self._local = threading.local()
+        self._connections: Dict[int, sqlite3.Connection] = {}
+        self._lock = threading.Lock()
+        self._wal_enabled = False
+        self.journal_mode = None
+        self.fts_enabled = False
         
     def get_connection(self):
-        """Get a new database connection for thread safety"""
-        # Always create a new connection to avoid threading issues
-        connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        """Get the cached database connection for the calling thread"""
+        connection = getattr(self._local, 'conn', None)
+        if connection is not None:
+            return connection
+        
+        # Long-lived connections keep compiled statements; leave room for every query shape
+        connection = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
         connection.row_factory = sqlite3.Row  # Enable column access by name
-        # Enable foreign key constraints
-        connection.execute("PRAGMA foreign_keys = ON")
+        # Per-connection settings, applied once when the connection is opened
+        connection.executescript(self.CONNECTION_PRAGMAS)
+        
+        with self._lock:
+            self._prune_connections()
+            stale = self._connections.pop(threading.get_ident(), None)
+            if stale is not None:
+                stale.close()
+            self._connections[threading.get_ident()] = connection
+        self._local.conn = connection
         return connection
     
-    def initialize_database(self):
-        """Create database tables if they don't exist"""
+    def _prune_connections(self):
+        """Close connections owned by threads that have exited (caller holds the lock)"""
+        alive = {thread.ident for thread in threading.enumerate()}
+        for ident in [ident for ident in self._connections if ident not in alive]:
+            self._connections.pop(ident).close()
+    
+    @contextmanager
+    def _conn(self):
+        """Yield the pooled connection, rolling back any open transaction on error"""
         conn = self.get_connection()
         try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+    
+    @contextmanager
+    def read_snapshot(self):
+        """Run several reads inside one deferred transaction on this thread's connection
+        
+        Every query made through this manager inside the block sees the same
+        snapshot and shares the connection's warm page cache.
+        """
+        conn = self.get_connection()
+        if conn.in_transaction:
+            # Already inside a transaction; join it rather than nesting
+            yield conn
+            return
+        
+        conn.execute("BEGIN DEFERRED")
+        try:
+            yield conn
+        finally:
+            conn.commit()
+    
+    def initialize_database(self):
+        """Create database tables if they don't exist"""
+        with self._conn() as conn:
             cursor = conn.cursor()
             
-            # Create claims table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS claims (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    entry_date TEXT NOT NULL,
-                    admission_date TEXT NOT NULL,
-                    customer_name TEXT NOT NULL,
-                    policy_number TEXT NOT NULL,
-                    hospital_name TEXT NOT NULL,
-                    company_name TEXT NOT NULL,
-                    claim_number TEXT,
-                    claim_status TEXT NOT NULL,
-                    claimed_amount REAL,
-                    approved_amount REAL,
-                    claim_type TEXT NOT NULL,
-                    remark TEXT,
-                    parent_claim_id INTEGER,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (parent_claim_id) REFERENCES claims (id)
-                )
-            ''')
+            # Switch to write-ahead logging once; the mode sticks to the database file
+            if not self._wal_enabled:
+                cursor.execute("PRAGMA journal_mode = WAL")
+                self.journal_mode = cursor.fetchone()[0]
+                self._wal_enabled = True
+            
+            # Upgrade an existing schema first; these steps depend on what is already there
+            self._migrate_cascade_delete(conn)
+            
+            # Name and policy indexes use NOCASE so prefix LIKE searches can seek on them;
+            # drop indexes created before that change so the schema script recreates them
+            for index_name in ('idx_customer_name', 'idx_policy_number'):
+                cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'index' AND name = ?", (index_name,))
+                row = cursor.fetchone()
+                if row and 'NOCASE' not in row[0].upper():
+                    cursor.execute(f'DROP INDEX {index_name}')
             
-            # Create indexes for better search performance
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_customer_name ON claims (customer_name)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_policy_number ON claims (policy_number)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_claim_status ON claims (claim_status)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_company_name ON claims (company_name)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_entry_date ON claims (entry_date)')
+            # Create claims table and indexes in one batch
+            cursor.executescript(SCHEMA_SQL)
             
             # Check if tpa_name column exists, add if not
             cursor.execute("PRAGMA table_info(claims)")
@@ -65,260 +364,385 @@ class DatabaseManager:
                 cursor.execute('ALTER TABLE claims ADD COLUMN tpa_name TEXT')
             
             conn.commit()
+            
+            self.fts_enabled = self._create_search_index(cursor)
+            self._create_stats_table(cursor)
+            conn.commit()
+    
+    def _migrate_cascade_delete(self, conn):
+        """Rebuild a claims table created before linked claims cascaded on delete"""
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA foreign_key_list(claims)")
+        if all(foreign_key['on_delete'] == 'CASCADE' for foreign_key in cursor.fetchall()):
+            return
+        
+        cursor.execute("PRAGMA table_info(claims)")
+        columns = ', '.join(column[1] for column in cursor.fetchall())
+        
+        # Foreign keys must be off while the table is swapped out
+        conn.commit()
+        conn.execute("PRAGMA foreign_keys = OFF")
+        try:
+            cursor.execute("BEGIN")
+            cursor.execute(CLAIMS_TABLE_SQL.format(table='claims_new'))
+            cursor.execute(f"INSERT INTO claims_new ({columns}) SELECT {columns} FROM claims")
+            cursor.execute("DROP TABLE claims")
+            cursor.execute("ALTER TABLE claims_new RENAME TO claims")
+            conn.commit()
+        except Exception:
+            # SQLite ignores the foreign_keys pragma inside an open transaction
+            conn.rollback()
+            raise
         finally:
-            conn.close()
+            conn.execute("PRAGMA foreign_keys = ON")
+    
+    def _create_search_index(self, cursor) -> bool:
+        """Create the claims_fts substring index and its sync triggers
+        
+        Returns False when this SQLite build has no FTS5 support, in which
+        case searches fall back to plain LIKE scans.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'claims_fts'")
+        is_new = cursor.fetchone() is None
+        
+        columns = ', '.join(FTS_COLUMNS)
+        new_values = ', '.join(f"new.{column}" for column in FTS_COLUMNS)
+        old_values = ', '.join(f"old.{column}" for column in FTS_COLUMNS)
+        
+        try:
+            # Trigram tokens keep LIKE '%text%' semantics while using the index
+            cursor.execute(f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS claims_fts USING fts5(
+                    {columns}, content='claims', content_rowid='id', tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError:
+            return False
+        
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS claims_fts_insert AFTER INSERT ON claims BEGIN
+                INSERT INTO claims_fts (rowid, {columns}) VALUES (new.id, {new_values});
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS claims_fts_delete AFTER DELETE ON claims BEGIN
+                INSERT INTO claims_fts (claims_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS claims_fts_update AFTER UPDATE ON claims BEGIN
+                INSERT INTO claims_fts (claims_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+                INSERT INTO claims_fts (rowid, {columns}) VALUES (new.id, {new_values});
+            END
+        """)
+        
+        # Index rows that existed before the search table was added
+        if is_new:
+            cursor.execute("INSERT INTO claims_fts (claims_fts) VALUES ('rebuild')")
+        
+        return True
+    
+    def _create_stats_table(self, cursor):
+        """Create the claim_stats summary table and the triggers that keep it current"""
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'claim_stats'")
+        is_new = cursor.fetchone() is None
+        
+        cursor.execute(CLAIM_STATS_TABLE_SQL)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS claim_stats_insert AFTER INSERT ON claims BEGIN
+                {_claim_stats_delta_sql('new', '+')}
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS claim_stats_delete AFTER DELETE ON claims BEGIN
+                {_claim_stats_delta_sql('old', '-')}
+                {CLAIM_STATS_PRUNE_SQL}
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS claim_stats_update
+            AFTER UPDATE OF claim_status, company_name, claimed_amount, approved_amount ON claims BEGIN
+                {_claim_stats_delta_sql('old', '-')}
+                {_claim_stats_delta_sql('new', '+')}
+                {CLAIM_STATS_PRUNE_SQL}
+            END
+        """)
+        
+        # Summarize rows that existed before the table was added
+        if is_new:
+            cursor.execute(CLAIM_STATS_REBUILD_SQL)
     
     def insert_claim(self, claim_data: Dict) -> int:
         """Insert a new claim and return the claim ID"""
-        conn = self.get_connection()
-        try:
+        with self._conn() as conn:
             cursor = conn.cursor()
             
-            # Add timestamp
-            claim_data['created_at'] = datetime.now().isoformat()
-            claim_data['updated_at'] = datetime.now().isoformat()
+            # Add timestamp; both fields share the same instant
+            now = datetime.now().isoformat()
+            claim_data['created_at'] = now
+            claim_data['updated_at'] = now
             
-            columns = ', '.join(claim_data.keys())
-            placeholders = ', '.join(['?' for _ in claim_data])
             values = list(claim_data.values())
             
-            query = f"INSERT INTO claims ({columns}) VALUES ({placeholders})"
-            cursor.execute(query, values)
+            cursor.execute(_insert_sql(tuple(claim_data.keys())), values)
             conn.commit()
             
             return cursor.lastrowid or 0
-        finally:
-            conn.close()
+    
+    def insert_claims(self, rows: List[Dict]) -> List[int]:
+        """Insert many claims in one transaction and return their IDs in input order"""
+        if not rows:
+            return []
+        
+        # Group rows by column set so each group is a single executemany
+        now = datetime.now().isoformat()
+        groups: Dict[Tuple[str, ...], List[int]] = {}
+        for index, claim_data in enumerate(rows):
+            claim_data['created_at'] = now
+            claim_data['updated_at'] = now
+            groups.setdefault(tuple(sorted(claim_data.keys())), []).append(index)
+        
+        claim_ids = [0] * len(rows)
+        with self._conn() as conn:
+            with conn:
+                cursor = conn.cursor()
+                for columns, indexes in groups.items():
+                    cursor.executemany(_insert_sql(columns),
+                                       [[rows[i][column] for column in columns] for i in indexes])
+                    
+                    # Rowids from one executemany inside the write transaction are contiguous
+                    last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                    first_id = last_id - len(indexes) + 1
+                    for offset, index in enumerate(indexes):
+                        claim_ids[index] = first_id + offset
+        
+        return claim_ids
     
     def update_claim(self, claim_id: int, claim_data: Dict) -> bool:
         """Update an existing claim"""
-        conn = self.get_connection()
-        try:
+        with self._conn() as conn:
             cursor = conn.cursor()
             
             # Add updated timestamp
             claim_data['updated_at'] = datetime.now().isoformat()
             
-            # Build SET clause
-            set_clause = ', '.join([f"{key} = ?" for key in claim_data.keys()])
             values = list(claim_data.values()) + [claim_id]
             
-            query = f"UPDATE claims SET {set_clause} WHERE id = ?"
-            cursor.execute(query, values)
+            cursor.execute(_update_sql(tuple(claim_data.keys())), values)
             conn.commit()
             
             return cursor.rowcount > 0
-        finally:
-            conn.close()
     
     def get_claim_by_id(self, claim_id: int) -> Optional[Dict]:
         """Get a single claim by ID"""
-        conn = self.get_connection()
-        try:
+        with self._conn() as conn:
             cursor = conn.cursor()
             
             cursor.execute("SELECT * FROM claims WHERE id = ?", (claim_id,))
             row = cursor.fetchone()
             
             return dict(row) if row else None
-        finally:
-            conn.close()
     
-    def search_claims(self, filters: Dict) -> List[Dict]:
-        """Search claims with various filters"""
-        conn = self.get_connection()
-        try:
+    def get_claim_with_linked(self, claim_id: int) -> Tuple[Optional[Dict], List[Dict]]:
+        """Get a claim and the claims linked to it with a single query
+        
+        Returns (claim, linked claims); claim is None when it does not exist.
+        """
+        with self._conn() as conn:
             cursor = conn.cursor()
             
-            # Build WHERE clause dynamically
-            where_conditions = []
-            values = []
-            
-            if filters.get('customer_name'):
-                where_conditions.append("customer_name LIKE ?")
-                values.append(f"%{filters['customer_name']}%")
+            cursor.execute(CLAIM_WITH_LINKED_SQL, (claim_id, claim_id))
+            claim, linked = None, []
+            for row in cursor.fetchall():
+                if row['id'] == claim_id:
+                    claim = dict(row)
+                else:
+                    linked.append(dict(row))
             
-            if filters.get('policy_number'):
-                where_conditions.append("policy_number LIKE ?")
-                values.append(f"%{filters['policy_number']}%")
-            
-            if filters.get('claim_status'):
-                where_conditions.append("claim_status = ?")
-                values.append(filters['claim_status'])
-            
-            if filters.get('claim_type'):
-                where_conditions.append("claim_type = ?")
-                values.append(filters['claim_type'])
-            
-            if filters.get('company_name'):
-                where_conditions.append("company_name = ?")
-                values.append(filters['company_name'])
-            
-            if filters.get('entry_date_from'):
-                where_conditions.append("entry_date >= ?")
-                values.append(filters['entry_date_from'])
+            return claim, linked
+    
+    def get_claim_with_parent(self, claim_id: int) -> Optional[Dict]:
+        """Get a single claim by ID plus its parent claim's display label (None if unlinked)"""
+        with self._conn() as conn:
+            cursor = conn.cursor()
             
-            if filters.get('entry_date_to'):
-                where_conditions.append("entry_date <= ?")
-                values.append(filters['entry_date_to'])
+            cursor.execute(CLAIM_WITH_PARENT_SQL, (claim_id,))
+            row = cursor.fetchone()
             
-            if filters.get('admission_date_from'):
-                where_conditions.append("admission_date >= ?")
-                values.append(filters['admission_date_from'])
+            return dict(row) if row else None
+    
+    def search_claims(self, filters: Dict, full_rows: bool = False, order_by: Optional[str] = None,
+                      desc: bool = False, limit: Optional[int] = None, offset: int = 0) -> List[sqlite3.Row]:
+        """Search claims with various filters (list columns only unless full_rows is set)
+        
+        claim_status, claim_type and company_name accept a single value or a
+        list/tuple of values to match any of. order_by names a list column to
+        sort by instead of the default newest-first entry date order. limit and
+        offset return one page of the results.
+        """
+        query, values = self._search_query(filters, full_rows, order_by, desc, limit, offset)
+        
+        with self._conn() as conn:
+            cursor = conn.cursor()
             
-            if filters.get('admission_date_to'):
-                where_conditions.append("admission_date <= ?")
-                values.append(filters['admission_date_to'])
+            cursor.execute(query, values)
+            rows = cursor.fetchall()
             
-            # Build complete query
-            query = "SELECT * FROM claims"
-            if where_conditions:
-                query += " WHERE " + " AND ".join(where_conditions)
-            query += " ORDER BY entry_date DESC, id DESC"
+            return rows
+    
+    def iter_claims(self, filters: Optional[Dict] = None, full_rows: bool = False,
+                    batch_size: int = 500) -> Iterator[sqlite3.Row]:
+        """Yield the claims search_claims would return (all claims when filters is empty)
+        
+        Rows are fetched from the cursor batch_size at a time instead of being
+        loaded into one list, so large exports can be streamed.
+        """
+        if filters:
+            query, values = self._search_query(filters, full_rows)
+        else:
+            query, values = (ALL_CLAIMS_FULL_SQL if full_rows else ALL_CLAIMS_SQL), ()
+        
+        with self._conn() as conn:
+            cursor = conn.cursor()
             
             cursor.execute(query, values)
-            rows = cursor.fetchall()
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield from rows
+    
+    def count_claims(self, filters: Dict) -> int:
+        """Count the claims search_claims would return for filters"""
+        # Reuse the cached SQL for this combination of active filters
+        active_keys, multi_counts = _filter_signature(filters)
+        query, filter_keys = _build_count_sql(active_keys, self.fts_enabled, multi_counts)
+        values = _bind_values(filters, filter_keys, self.fts_enabled)
+        
+        with self._conn() as conn:
+            cursor = conn.cursor()
             
-            return [dict(row) for row in rows]
-        finally:
-            conn.close()
+            cursor.execute(query, values)
+            return cursor.fetchone()[0]
     
-    def get_all_claims(self) -> List[Dict]:
-        """Get all claims ordered by entry date"""
-        conn = self.get_connection()
-        try:
+    def _search_query(self, filters: Dict, full_rows: bool = False, order_by: Optional[str] = None,
+                      desc: bool = False, limit: Optional[int] = None, offset: int = 0) -> Tuple[str, List]:
+        """Get the SQL and bound values for a claim search"""
+        if order_by is not None and order_by not in SORTABLE_COLUMNS:
+            raise ValueError(f"Cannot sort claims by {order_by!r}")
+        
+        # Reuse the cached SQL for this combination of active filters
+        active_keys, multi_counts = _filter_signature(filters)
+        query, filter_keys = _build_search_sql(
+            active_keys, self.fts_enabled, '*' if full_rows else LIST_COLUMNS, multi_counts,
+            order_by, desc, limit is not None)
+        values = _bind_values(filters, filter_keys, self.fts_enabled)
+        if limit is not None:
+            values += [limit, offset]
+        return query, values
+    
+    def get_all_claims(self, full_rows: bool = False) -> List[sqlite3.Row]:
+        """Get all claims ordered by entry date (list columns only unless full_rows is set)"""
+        with self._conn() as conn:
             cursor = conn.cursor()
             
-            cursor.execute("SELECT * FROM claims ORDER BY entry_date DESC, id DESC")
+            cursor.execute(ALL_CLAIMS_FULL_SQL if full_rows else ALL_CLAIMS_SQL)
             rows = cursor.fetchall()
             
-            return [dict(row) for row in rows]
-        finally:
-            conn.close()
+            return rows
     
-    def get_linked_claims(self, parent_claim_id: int) -> List[Dict]:
+    def get_linked_claims(self, parent_claim_id: int) -> List[sqlite3.Row]:
         """Get all claims linked to a parent claim"""
-        conn = self.get_connection()
-        try:
+        with self._conn() as conn:
             cursor = conn.cursor()
             
-            cursor.execute("SELECT * FROM claims WHERE parent_claim_id = ?", (parent_claim_id,))
+            cursor.execute(LINKED_CLAIMS_SQL, (parent_claim_id,))
             rows = cursor.fetchall()
             
-            return [dict(row) for row in rows]
-        finally:
-            conn.close()
+            return rows
     
-    def get_main_claims(self) -> List[Dict]:
+    def get_main_claims(self) -> List[sqlite3.Row]:
         """Get claims that can be used as parent claims (Cashless or Reimbursement)"""
-        conn = self.get_connection()
-        try:
+        with self._conn() as conn:
             cursor = conn.cursor()
             
-            cursor.execute("""
-                SELECT id, customer_name, policy_number, claim_number, claim_type, entry_date, admission_date
-                FROM claims 
-                WHERE claim_type IN ('Cashless', 'Reimbursement')
-                ORDER BY entry_date DESC
-            """)
+            query, _ = _build_main_claims_sql(frozenset())
+            cursor.execute(query)
             rows = cursor.fetchall()
             
-            return [dict(row) for row in rows]
-        finally:
-            conn.close()
+            return rows
     
-    def get_filtered_main_claims(self, filters: Dict) -> List[Dict]:
+    def get_filtered_main_claims(self, filters: Dict) -> List[sqlite3.Row]:
         """Get filtered main claims that can be used as parent claims"""
-        conn = self.get_connection()
-        try:
+        with self._conn() as conn:
             cursor = conn.cursor()
             
-            # Build WHERE clause for main claims with filters
-            where_conditions = ["claim_type IN ('Cashless', 'Reimbursement')"]
-            values = []
-            
-            if filters.get('customer_name'):
-                where_conditions.append("customer_name LIKE ?")
-                values.append(f"%{filters['customer_name']}%")
-            
-            if filters.get('policy_number'):
-                where_conditions.append("policy_number LIKE ?")
-                values.append(f"%{filters['policy_number']}%")
-            
-            if filters.get('admission_date_from'):
-                where_conditions.append("admission_date >= ?")
-                values.append(filters['admission_date_from'])
-            
-            if filters.get('admission_date_to'):
-                where_conditions.append("admission_date <= ?")
-                values.append(filters['admission_date_to'])
-            
-            query = f"""
-                SELECT id, customer_name, policy_number, claim_number, claim_type, entry_date, admission_date
-                FROM claims 
-                WHERE {' AND '.join(where_conditions)}
-                ORDER BY entry_date DESC
-            """
+            # Reuse the cached SQL for this combination of active filters
+            active_keys, multi_counts = _filter_signature(filters)
+            query, filter_keys = _build_main_claims_sql(active_keys, self.fts_enabled, multi_counts)
+            values = _bind_values(filters, filter_keys, self.fts_enabled)
             
             cursor.execute(query, values)
             rows = cursor.fetchall()
             
-            return [dict(row) for row in rows]
-        finally:
-            conn.close()
+            return rows
     
     def delete_claim(self, claim_id: int) -> bool:
         """Delete a claim (with cascade for linked claims)"""
-        conn = self.get_connection()
         try:
-            cursor = conn.cursor()
-            
-            # First delete linked claims
-            cursor.execute("DELETE FROM claims WHERE parent_claim_id = ?", (claim_id,))
-            # Then delete the main claim
-            cursor.execute("DELETE FROM claims WHERE id = ?", (claim_id,))
-            conn.commit()
-            return True
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                
+                # Linked claims are removed by ON DELETE CASCADE
+                cursor.execute("DELETE FROM claims WHERE id = ?", (claim_id,))
+                conn.commit()
+                return True
         except Exception as e:
-            conn.rollback()
             return False
-        finally:
-            conn.close()
     
     def get_claim_statistics(self) -> Dict:
         """Get basic statistics about claims"""
-        conn = self.get_connection()
-        try:
+        with self._conn() as conn:
             cursor = conn.cursor()
             
-            stats = {}
-            
-            # Total claims
-            cursor.execute("SELECT COUNT(*) FROM claims")
-            stats['total_claims'] = cursor.fetchone()[0]
-            
-            # Claims by status
-            cursor.execute("SELECT claim_status, COUNT(*) FROM claims GROUP BY claim_status")
-            stats['by_status'] = {row[0]: row[1] for row in cursor.fetchall()}
-            
-            # Claims by company
-            cursor.execute("SELECT company_name, COUNT(*) FROM claims GROUP BY company_name")
-            stats['by_company'] = {row[0]: row[1] for row in cursor.fetchall()}
-            
-            # Total claimed amount
-            cursor.execute("SELECT SUM(claimed_amount) FROM claims WHERE claimed_amount IS NOT NULL")
-            result = cursor.fetchone()[0]
-            stats['total_claimed'] = result if result else 0
+            # Read the trigger-maintained summary rows instead of aggregating the claims table;
+            # amounts are rounded to paise so repeated trigger updates cannot show float drift
+            cursor.execute("""
+                SELECT kind, name, total, ROUND(claimed, 2), ROUND(approved, 2)
+                FROM claim_stats ORDER BY kind, name
+            """)
             
-            # Total approved amount
-            cursor.execute("SELECT SUM(approved_amount) FROM claims WHERE approved_amount IS NOT NULL")
-            result = cursor.fetchone()[0]
-            stats['total_approved'] = result if result else 0
+            stats = {'by_status': {}, 'by_company': {},
+                     'total_claims': 0, 'total_claimed': 0, 'total_approved': 0}
+            for kind, name, total, claimed, approved in cursor.fetchall():
+                if kind == 'status':
+                    stats['by_status'][name] = total
+                elif kind == 'company':
+                    stats['by_company'][name] = total
+                else:
+                    stats['total_claims'] = total
+                    stats['total_claimed'] = claimed
+                    stats['total_approved'] = approved
             
             return stats
-        finally:
-            conn.close()
+    
+    def get_dashboard_bundle(self, claims_limit: Optional[int] = None) -> Dict:
+        """Get statistics, the claim list and parent-claim options from a single read transaction
+        
+        claims_limit caps the claim list to its newest claims.
+        """
+        with self.read_snapshot():
+            return {
+                'statistics': self.get_claim_statistics(),
+                'claims': (self.get_all_claims() if claims_limit is None
+                           else self.search_claims({}, limit=claims_limit)),
+                'main_claims': self.get_main_claims()
+            }
     
     def close(self):
-        """Close database connection - no longer needed with per-request connections"""
-        pass
+        """Close all pooled database connections"""
+        with self._lock:
+            for connection in self._connections.values():
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
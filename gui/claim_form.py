@@ -4,8 +4,9 @@ Claim form tab for creating and editing insurance claims
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, List
 
 from gui.components import DatePicker, CurrencyEntry
 from utils.validators import ClaimValidator
@@ -20,6 +21,15 @@ class ClaimFormTab:
         self.current_claim_id = None
         self.validator = ClaimValidator()
         
+        # Parent claim options, cached until a claim is saved or deleted
+        self._parent_claims_cache: Optional[List[str]] = None
+        self._parent_claims_loading = False
+        # Bumped on invalidation so a fetch started before it cannot fill the cache
+        self._parent_claims_generation = 0
+        
+        # Database calls run on one worker thread so the Tk mainloop never blocks on disk
+        self._db_exec = ThreadPoolExecutor(max_workers=1)
+        
         # Company dropdown options
         self.companies = [
             "NIVA", "HDFC", "TATA", "CARE", "NEW INDIA", 
@@ -140,7 +150,9 @@ class ClaimFormTab:
         # Parent Claim (for linking)
         ttk.Label(form_frame, text="Link to Main Claim:").grid(row=row, column=2, sticky="w", padx=(0, 10), pady=5)
         self.parent_claim_var = tk.StringVar()
-        self.parent_claim = ttk.Combobox(form_frame, textvariable=self.parent_claim_var, state="readonly")
+        # Options are loaded on first use rather than when the tab is built
+        self.parent_claim = ttk.Combobox(form_frame, textvariable=self.parent_claim_var, state="readonly",
+                                         postcommand=self._ensure_parent_claims_loaded)
         self.parent_claim.grid(row=row, column=3, sticky="ew", pady=5)
         
         row += 1
@@ -168,22 +180,47 @@ class ClaimFormTab:
         
         # Bind events
         self.claim_type.bind('<<ComboboxSelected>>', self.on_claim_type_changed)
-        
-        # Load parent claims for linking
-        self.load_parent_claims()
+        self.parent_claim.bind('<Button-1>', self._ensure_parent_claims_loaded)
     
     def load_parent_claims(self):
         """Load main claims that can be used as parent claims"""
-        main_claims = self.db_manager.get_main_claims()
-        parent_options = [""]  # Empty option for no linking
-        
-        for claim in main_claims:
-            display_text = f"{claim['id']} - {claim['customer_name']} ({claim['policy_number']})"
-            if claim['claim_number']:
-                display_text += f" - {claim['claim_number']}"
-            parent_options.append(display_text)
+        if self._parent_claims_cache is not None:
+            self.parent_claim['values'] = self._parent_claims_cache
+            return
+        if self._parent_claims_loading:
+            return
         
-        self.parent_claim['values'] = parent_options
+        def fetch_options():
+            # Empty option for no linking; labels come preformatted from the query
+            return [""] + [claim['label'] for claim in self.db_manager.get_main_claims()]
+        
+        def on_loaded(options):
+            if generation != self._parent_claims_generation:
+                return  # Invalidated while loading; the options may be stale
+            self._parent_claims_loading = False
+            self._parent_claims_cache = options
+            self.parent_claim['values'] = options
+        
+        def on_failed(error):
+            if generation != self._parent_claims_generation:
+                return
+            self._parent_claims_loading = False
+            messagebox.showerror("Database Error", f"Failed to load main claims: {str(error)}")
+        
+        generation = self._parent_claims_generation
+        self._parent_claims_loading = True
+        self._run_db(fetch_options, on_done=on_loaded, on_error=on_failed)
+    
+    def _ensure_parent_claims_loaded(self, event=None):
+        """Load parent claim options the first time the link picker is needed"""
+        if self._parent_claims_cache is None:
+            self.load_parent_claims()
+    
+    def invalidate_parent_cache(self):
+        """Drop cached parent claim options so the next load queries the database"""
+        self._parent_claims_generation += 1
+        self._parent_claims_cache = None
+        self._parent_claims_loading = False
     
     def on_claim_type_changed(self, event=None):
         """Handle claim type selection"""
@@ -192,6 +229,8 @@ class ClaimFormTab:
         # Enable/disable parent claim linking based on claim type
         if claim_type in ['Pre-post', 'Hospital cash']:
             self.parent_claim['state'] = 'readonly'
+            # Start fetching options as soon as linking becomes possible
+            self._ensure_parent_claims_loaded()
         else:
             self.parent_claim['state'] = 'disabled'
             self.parent_claim_var.set("")
@@ -245,19 +284,16 @@ class ClaimFormTab:
         
         # Set parent claim if exists
         if data.get('parent_claim_id'):
-            parent_claim = self.db_manager.get_claim_by_id(data['parent_claim_id'])
-            if parent_claim:
-                display_text = f"{parent_claim['id']} - {parent_claim['customer_name']} ({parent_claim['policy_number']})"
-                if parent_claim['claim_number']:
-                    display_text += f" - {parent_claim['claim_number']}"
-                self.parent_claim_var.set(display_text)
+            self._ensure_parent_claims_loaded()
+            # Label comes joined in from get_claim_with_parent
+            if data.get('parent_label'):
+                self.parent_claim_var.set(data['parent_label'])
         
         # Trigger claim type change event
         self.on_claim_type_changed()
     
-    def validate_form(self) -> bool:
-        """Validate form data"""
-        data = self.get_form_data()
+    def validate_form(self, data: Dict) -> bool:
+        """Validate form data already read by get_form_data"""
         errors = self.validator.validate_claim(data)
         
         if errors:
@@ -269,33 +305,81 @@ class ClaimFormTab:
     
     def save_claim(self):
         """Save or update the claim"""
-        if not self.validate_form():
+        # Read the widgets once and reuse the same data for validation and saving
+        data = self.get_form_data()
+        if not self.validate_form(data):
+            return
+        
+        # Block a second submit while the write is in flight
+        self.save_button.config(state='disabled')
+        
+        if self.current_claim_id:
+            # Update existing claim
+            self._run_db(self.db_manager.update_claim, self.current_claim_id, data,
+                         on_done=self._on_claim_updated, on_error=self._on_save_failed)
+        else:
+            # Insert new claim
+            self._run_db(self.db_manager.insert_claim, data,
+                         on_done=self._on_claim_inserted, on_error=self._on_save_failed)
+    
+    def _on_claim_updated(self, success: bool):
+        """Finish an update once the worker thread has written it"""
+        self.save_button.config(state='normal')
+        if success:
+            self.invalidate_parent_cache()
+            self.main_window.invalidate_stats_cache()
+            self.main_window.invalidate_search_cache()
+            self.main_window.set_status("Claim updated successfully")
+            messagebox.showinfo("Success", "Claim updated successfully!")
+        else:
+            messagebox.showerror("Error", "Failed to update claim.")
+        
+        self._refresh_search()
+    
+    def _on_claim_inserted(self, claim_id: int):
+        """Finish an insert once the worker thread has written it"""
+        self.save_button.config(state='normal')
+        self.invalidate_parent_cache()
+        self.main_window.invalidate_stats_cache()
+        self.main_window.invalidate_search_cache()
+        self.main_window.set_status(f"New claim created with ID: {claim_id}")
+        messagebox.showinfo("Success", f"Claim saved successfully with ID: {claim_id}")
+        self.reset_form()
+        
+        self._refresh_search()
+    
+    def _on_save_failed(self, error: Exception):
+        """Report a failed insert or update"""
+        self.save_button.config(state='normal')
+        messagebox.showerror("Error", f"Failed to save claim: {str(error)}")
+    
+    def _refresh_search(self):
+        """Refresh search results if available"""
+        if hasattr(self.main_window, 'refresh_search'):
+            self.main_window.refresh_search()
+    
+    def _run_db(self, func, *args, on_done=None, on_error=None):
+        """Run a database call on the worker thread and deliver its result on the Tk thread"""
+        future = self._db_exec.submit(func, *args)
+        self._poll(future, on_done, on_error)
+    
+    def _poll(self, future, on_done, on_error):
+        """Check a pending database call every 50 ms without blocking the mainloop"""
+        if not future.done():
+            self.frame.after(50, self._poll, future, on_done, on_error)
             return
         
         try:
-            data = self.get_form_data()
-            
-            if self.current_claim_id:
-                # Update existing claim
-                success = self.db_manager.update_claim(self.current_claim_id, data)
-                if success:
-                    self.main_window.set_status("Claim updated successfully")
-                    messagebox.showinfo("Success", "Claim updated successfully!")
-                else:
-                    messagebox.showerror("Error", "Failed to update claim.")
-            else:
-                # Insert new claim
-                claim_id = self.db_manager.insert_claim(data)
-                self.main_window.set_status(f"New claim created with ID: {claim_id}")
-                messagebox.showinfo("Success", f"Claim saved successfully with ID: {claim_id}")
-                self.reset_form()
-            
-            # Refresh search results if available
-            if hasattr(self.main_window, 'refresh_search'):
-                self.main_window.refresh_search()
-                
+            result = future.result()
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to save claim: {str(e)}")
+            if on_error:
+                on_error(e)
+            else:
+                messagebox.showerror("Database Error", str(e))
+            return
+        
+        if on_done:
+            on_done(result)
     
     def reset_form(self):
         """Clear all form fields"""
@@ -316,9 +400,6 @@ class ClaimFormTab:
         
         # Update button text
         self.save_button.config(text="Save Claim")
-        
-        # Reload parent claims
-        self.load_parent_claims()
     
     def load_claim(self, claim_data: Dict):
         """Load claim data for editing"""
@@ -6,7 +6,41 @@ import tkinter as tk
 from tkinter import ttk
 from datetime import datetime
 import calendar
-from typing import Optional, Union
+import functools
+from typing import Dict, List, Optional, Tuple, Union
+
+# Deletes every ASCII character except digits and the decimal point
+_CURRENCY_KEEP = frozenset('0123456789.')
+_CURRENCY_DELETE_TABLE = str.maketrans('', '', ''.join(chr(i) for i in range(128) if chr(i) not in _CURRENCY_KEEP))
+
+# calendar.month_name is locale-aware and rebuilds each name on lookup
+_MONTH_NAMES = tuple(calendar.month_name)
+
+def _shift_month(year: int, month: int, delta: int) -> Tuple[int, int]:
+    """Return the (year, month) that is delta months away"""
+    year, month_index = divmod(year * 12 + month - 1 + delta, 12)
+    return year, month_index + 1
+
+_DATE_FORMATS = ('%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%Y/%m/%d')
+
+@functools.lru_cache(maxsize=256)
+def _parse_date(text: str) -> Optional[str]:
+    """Parse user-entered date text into a YYYY-MM-DD string, or None if invalid"""
+    # Fast path for year-first input (YYYY-MM-DD or YYYY/MM/DD): fromisoformat is
+    # implemented in C and skips strptime's format parsing
+    if len(text) == 10 and text[4] in '-/':
+        try:
+            return datetime.fromisoformat(text.replace('/', '-')).strftime('%Y-%m-%d')
+        except ValueError:
+            pass
+    
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+    
+    return None
 
 class DatePicker(ttk.Frame):
     """Custom date picker widget"""
@@ -15,6 +49,10 @@ class DatePicker(ttk.Frame):
         super().__init__(parent, **kwargs)
         
         self.allow_empty = allow_empty
+        self._calendar_window = None
+        self._monthcal_cache: Dict[Tuple[int, int], List[List[int]]] = {}
+        # Pending debounced format pass; set_date below validates and reads it
+        self._debounce_id = None
         
         # Create date entry
         self.date_var = tk.StringVar()
@@ -34,18 +72,44 @@ class DatePicker(ttk.Frame):
         
         # Bind validation
         self.date_entry.bind('<FocusOut>', self.validate_date)
-        self.date_entry.bind('<KeyRelease>', self.format_date)
+        self.date_entry.bind('<KeyRelease>', self._schedule_format)
+    
+    def _schedule_format(self, event=None):
+        """Collapse a burst of keystrokes into a single format pass"""
+        if self._debounce_id:
+            self.after_cancel(self._debounce_id)
+        self._debounce_id = self.after(100, self._do_format)
+    
+    def _do_format(self):
+        """Run the debounced format pass"""
+        self._debounce_id = None
+        self.format_date()
     
     def format_date(self, event=None):
         """Format date as user types"""
         text = self.date_var.get()
-        if len(text) == 2 or len(text) == 5:
+        if self.date_entry.index(tk.INSERT) != len(text):
+            # Editing mid-field: inserting separators would jump the cursor
+            return
+        if text.isdigit() and 2 <= len(text) <= 8:
+            # Several digits typed within one debounce window: insert both separators
+            formatted = text[:2] + '/' + text[2:4]
+            if len(text) >= 4:
+                formatted += '/' + text[4:]
+            self.date_var.set(formatted)
+            self.date_entry.icursor(len(formatted))
+        elif len(text) == 2 or len(text) == 5:
             if not text.endswith('/'):
                 self.date_var.set(text + '/')
                 self.date_entry.icursor(len(text) + 1)
     
     def validate_date(self, event=None):
         """Validate and format the date"""
+        if self._debounce_id:
+            # Apply pending formatting before validating
+            self.after_cancel(self._debounce_id)
+            self._do_format()
+        
         text = self.date_var.get().strip()
         
         if not text and self.allow_empty:
@@ -54,32 +118,20 @@ class DatePicker(ttk.Frame):
         if not text:
             return False
         
-        try:
-            # Try different date formats
-            for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%Y/%m/%d']:
-                try:
-                    date_obj = datetime.strptime(text, fmt)
-                    self.date_var.set(date_obj.strftime('%Y-%m-%d'))
-                    return True
-                except ValueError:
-                    continue
-            
+        iso_date = _parse_date(text)
+        if iso_date is None:
             # If no format worked, show error
             self.date_var.set("")
             return False
-            
-        except Exception:
-            self.date_var.set("")
-            return False
+        
+        self.date_var.set(iso_date)
+        return True
     
     def show_calendar(self):
         """Show calendar popup"""
-        calendar_window = tk.Toplevel(self)
-        calendar_window.title("Select Date")
-        calendar_window.geometry("250x220")
-        calendar_window.resizable(False, False)
-        calendar_window.transient(self.winfo_toplevel())
-        calendar_window.grab_set()
+        if self._calendar_window is None:
+            self._build_calendar_window()
+        calendar_window = self._calendar_window
         
         # Position calendar window
         x = self.winfo_rootx()
@@ -90,10 +142,33 @@ class DatePicker(ttk.Frame):
         current_date = datetime.now()
         try:
             if self.date_var.get():
-                current_date = datetime.strptime(self.date_var.get(), '%Y-%m-%d')
+                current_date = datetime.fromisoformat(self.date_var.get())
         except ValueError:
             pass
         
+        self.cal_month_var.set(current_date.month)
+        self.cal_year_var.set(current_date.year)
+        
+        # Fill calendar
+        self.create_calendar(current_date.day)
+        
+        # Update month label
+        self._month_label.config(text=f"{_MONTH_NAMES[self.cal_month_var.get()]} {self.cal_year_var.get()}")
+        
+        calendar_window.deiconify()
+        calendar_window.grab_set()
+    
+    def _build_calendar_window(self):
+        """Create the calendar popup once; later calls to show_calendar reuse it"""
+        calendar_window = tk.Toplevel(self)
+        calendar_window.withdraw()
+        calendar_window.title("Select Date")
+        calendar_window.geometry("250x220")
+        calendar_window.resizable(False, False)
+        calendar_window.transient(self.winfo_toplevel())
+        calendar_window.protocol("WM_DELETE_WINDOW", self._hide_calendar)
+        self._calendar_window = calendar_window
+        
         # Calendar frame
         cal_frame = ttk.Frame(calendar_window, padding="10")
         cal_frame.pack(fill=tk.BOTH, expand=True)
@@ -102,96 +177,107 @@ class DatePicker(ttk.Frame):
         nav_frame = ttk.Frame(cal_frame)
         nav_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.cal_month_var = tk.IntVar(value=current_date.month)
-        self.cal_year_var = tk.IntVar(value=current_date.year)
+        self.cal_month_var = tk.IntVar()
+        self.cal_year_var = tk.IntVar()
         
-        ttk.Button(nav_frame, text="<", width=3, command=lambda: self.change_month(-1, calendar_window, cal_frame)).pack(side=tk.LEFT)
+        ttk.Button(nav_frame, text="<", width=3, command=lambda: self.change_month(-1)).pack(side=tk.LEFT)
         
-        month_label = ttk.Label(nav_frame, text="")
-        month_label.pack(side=tk.LEFT, expand=True)
+        self._month_label = ttk.Label(nav_frame, text="")
+        self._month_label.pack(side=tk.LEFT, expand=True)
         
-        ttk.Button(nav_frame, text=">", width=3, command=lambda: self.change_month(1, calendar_window, cal_frame)).pack(side=tk.RIGHT)
+        ttk.Button(nav_frame, text=">", width=3, command=lambda: self.change_month(1)).pack(side=tk.RIGHT)
         
         # Calendar grid
         self.calendar_frame = ttk.Frame(cal_frame)
         self.calendar_frame.pack()
         
-        # Create calendar
-        self.create_calendar(calendar_window, current_date.day)
-        
-        # Update month label
-        month_label.config(text=f"{calendar.month_name[self.cal_month_var.get()]} {self.cal_year_var.get()}")
+        # Day headers, built once alongside the day buttons
+        days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+        self._day_header_labels = [
+            ttk.Label(self.calendar_frame, text=day, font=('Arial', 8, 'bold'))
+            for day in days
+        ]
+        for i, label in enumerate(self._day_header_labels):
+            label.grid(row=0, column=i, padx=1, pady=1)
+        
+        # Day buttons (6 weeks x 7 days), created once and reconfigured per month
+        self._day_buttons = []
+        for week_num in range(1, 7):
+            week_buttons = []
+            for day_num in range(7):
+                btn = tk.Button(self.calendar_frame, width=3, height=1)
+                btn.configure(command=lambda b=btn: self._on_day_click(b))
+                btn.grid(row=week_num, column=day_num, padx=1, pady=1)
+                week_buttons.append(btn)
+            self._day_buttons.append(week_buttons)
+        self._day_button_bg = self._day_buttons[0][0].cget('bg')
         
         # Today button
-        ttk.Button(cal_frame, text="Today", command=lambda: self.select_date(datetime.now(), calendar_window)).pack(pady=(10, 0))
+        ttk.Button(cal_frame, text="Today", command=lambda: self.select_date(datetime.now())).pack(pady=(10, 0))
     
-    def create_calendar(self, calendar_window, selected_day=None):
-        """Create calendar grid"""
-        # Clear existing calendar
-        for widget in self.calendar_frame.winfo_children():
-            widget.destroy()
-        
-        # Day headers
-        days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        for i, day in enumerate(days):
-            ttk.Label(self.calendar_frame, text=day, font=('Arial', 8, 'bold')).grid(row=0, column=i, padx=1, pady=1)
-        
-        # Calendar days
-        cal = calendar.monthcalendar(self.cal_year_var.get(), self.cal_month_var.get())
-        
-        for week_num, week in enumerate(cal, start=1):
-            for day_num, day in enumerate(week):
+    def _hide_calendar(self):
+        """Hide the calendar popup so the next show_calendar can reuse it"""
+        self._calendar_window.grab_release()
+        self._calendar_window.withdraw()
+    
+    def create_calendar(self, selected_day=None):
+        """Fill the calendar grid for the current month"""
+        year, month = self.cal_year_var.get(), self.cal_month_var.get()
+        cal = self._monthcal(year, month)
+        
+        for week_num, week_buttons in enumerate(self._day_buttons):
+            week = cal[week_num] if week_num < len(cal) else [0] * 7
+            for btn, day in zip(week_buttons, week):
                 if day == 0:
                     # Empty cell
-                    ttk.Label(self.calendar_frame, text="").grid(row=week_num, column=day_num, padx=1, pady=1)
-                else:
-                    # Day button
-                    btn = tk.Button(
-                        self.calendar_frame, 
-                        text=str(day), 
-                        width=3, 
-                        height=1,
-                        command=lambda d=day: self.select_date(
-                            datetime(self.cal_year_var.get(), self.cal_month_var.get(), d),
-                            calendar_window
-                        )
-                    )
-                    
+                    btn.grid_remove()
+                    continue
+                
+                btn.day = day
+                btn.configure(
+                    text=str(day),
                     # Highlight selected day
-                    if day == selected_day:
-                        btn.config(bg='lightblue')
-                    
-                    btn.grid(row=week_num, column=day_num, padx=1, pady=1)
+                    bg='lightblue' if day == selected_day else self._day_button_bg
+                )
+                btn.grid()
+        
+        # Users usually page one month at a time, so have the neighbours ready
+        self.after_idle(self._prefetch_adjacent_months, year, month)
     
-    def change_month(self, delta, calendar_window, cal_frame):
+    def _monthcal(self, year: int, month: int) -> List[List[int]]:
+        """Return calendar.monthcalendar for the month, memoized per picker"""
+        key = (year, month)
+        weeks = self._monthcal_cache.get(key)
+        if weeks is None:
+            weeks = self._monthcal_cache[key] = calendar.monthcalendar(year, month)
+        return weeks
+    
+    def _prefetch_adjacent_months(self, year: int, month: int):
+        """Fill the month cache for the months either side of the one shown"""
+        for delta in (-1, 1):
+            self._monthcal(*_shift_month(year, month, delta))
+    
+    def _on_day_click(self, btn):
+        """Select the day shown on a calendar button"""
+        self.select_date(datetime(self.cal_year_var.get(), self.cal_month_var.get(), btn.day))
+    
+    def change_month(self, delta):
         """Change calendar month"""
-        new_month = self.cal_month_var.get() + delta
-        new_year = self.cal_year_var.get()
-        
-        if new_month > 12:
-            new_month = 1
-            new_year += 1
-        elif new_month < 1:
-            new_month = 12
-            new_year -= 1
+        new_year, new_month = _shift_month(self.cal_year_var.get(), self.cal_month_var.get(), delta)
         
         self.cal_month_var.set(new_month)
         self.cal_year_var.set(new_year)
         
         # Update month label
-        for widget in cal_frame.winfo_children():
-            if isinstance(widget, ttk.Frame):
-                for child in widget.winfo_children():
-                    if isinstance(child, ttk.Label) and child.cget('text').count(' ') == 1:
-                        child.config(text=f"{calendar.month_name[new_month]} {new_year}")
-        
-        # Recreate calendar
-        self.create_calendar(calendar_window)
+        self._month_label.config(text=f"{_MONTH_NAMES[new_month]} {new_year}")
+        
+        # Refill calendar
+        self.create_calendar()
     
-    def select_date(self, date, calendar_window):
+    def select_date(self, date):
         """Select a date from calendar"""
         self.date_var.set(date.strftime('%Y-%m-%d'))
-        calendar_window.destroy()
+        self._hide_calendar()
     
     def get_date(self) -> str:
         """Get the current date value"""
@@ -223,15 +309,34 @@ class CurrencyEntry(ttk.Frame):
         self.entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         # Bind validation
-        self.entry.bind('<KeyRelease>', self.format_amount)
+        self._debounce_id = None
+        self._last_formatted = None
+        self.entry.bind('<KeyRelease>', self._schedule_format)
         self.entry.bind('<FocusOut>', self.validate_amount)
     
+    def _schedule_format(self, event=None):
+        """Collapse a burst of keystrokes into a single format pass"""
+        if self._debounce_id:
+            self.after_cancel(self._debounce_id)
+        self._debounce_id = self.after(100, self._do_format)
+    
+    def _do_format(self):
+        """Run the debounced format pass"""
+        self._debounce_id = None
+        self.format_amount()
+    
     def format_amount(self, event=None):
         """Format amount with commas"""
         text = self.amount_var.get()
+        if text == self._last_formatted:
+            # Already formatted by the previous pass; nothing to redo
+            return
         
         # Remove non-numeric characters except decimal point
-        cleaned = ''.join(c for c in text if c.isdigit() or c == '.')
+        cleaned = text.translate(_CURRENCY_DELETE_TABLE)
+        if not cleaned.isascii():
+            # Rare pasted non-ASCII input (e.g. a currency symbol) takes the slow path
+            cleaned = ''.join(c for c in cleaned if c.isdigit() or c == '.')
         
         try:
             # Split by decimal point
@@ -244,10 +349,12 @@ class CurrencyEntry(ttk.Frame):
                     formatted = f"{int(whole):,}"
                     if decimal:
                         formatted += f".{decimal}"
+                    self._last_formatted = formatted
                     self.amount_var.set(formatted)
             else:
                 if cleaned:
-                    self.amount_var.set(f"{int(cleaned):,}")
+                    self._last_formatted = f"{int(cleaned):,}"
+                    self.amount_var.set(self._last_formatted)
         except ValueError:
             pass
     
@@ -298,21 +405,35 @@ class SearchableCombobox(ttk.Combobox):
     def __init__(self, parent, values=None, **kwargs):
         super().__init__(parent, **kwargs)
         
-        self.all_values = values or []
-        self['values'] = self.all_values
+        self.update_values(values or [])
         
         # Bind events for search functionality
         self.bind('<KeyRelease>', self.on_keyrelease)
         self.bind('<Button-1>', self.on_click)
     
+    def update_values(self, values):
+        """Replace the full value list and its lowercased search keys together"""
+        self.all_values = list(values)
+        self._lower_values = [value.lower() for value in self.all_values]
+        self._last_typed = ''
+        self._last_matches = list(zip(self._lower_values, self.all_values))
+        self['values'] = self.all_values
+    
     def on_keyrelease(self, event):
         """Filter values based on typed text"""
         typed = self.get().lower()
         
         if typed == '':
-            filtered_values = self.all_values
+            matches = list(zip(self._lower_values, self.all_values))
+        elif self._last_typed and typed.startswith(self._last_typed):
+            # Extending the previous query can only narrow its matches
+            matches = [pair for pair in self._last_matches if typed in pair[0]]
         else:
-            filtered_values = [item for item in self.all_values if typed in item.lower()]
+            matches = [pair for pair in zip(self._lower_values, self.all_values) if typed in pair[0]]
+        
+        self._last_typed = typed
+        self._last_matches = matches
+        filtered_values = [value for _, value in matches]
         
         self['values'] = filtered_values
         
@@ -3,20 +3,27 @@ Main window for Insurance Claim Management System
 Contains the primary GUI layout and tab management
 """
 
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Dict
 
-from gui.claim_form import ClaimFormTab
-from gui.search_tab import SearchTab
 from database import DatabaseManager
 
+# Seconds that claim statistics are reused before querying again
+STATS_CACHE_TTL = 30
+
 class MainWindow:
     def __init__(self, root: tk.Tk, db_manager: DatabaseManager):
         """Initialize the main application window"""
         self.root = root
         self.db_manager = db_manager
         
+        # Statistics are reused for a short window so repeated View > Statistics clicks skip the query
+        self._stats_cache = None
+        self._stats_cache_ts = 0
+        self._status_after_id = None
+        
         self.setup_window()
         self.create_widgets()
         self.setup_menu()
@@ -61,13 +68,16 @@ class MainWindow:
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.grid(row=1, column=0, sticky="nsew")
         
-        # Create tabs
+        # Create tabs; the search tab is built the first time it is shown
+        from gui.claim_form import ClaimFormTab
         self.claim_form_tab = ClaimFormTab(self.notebook, self.db_manager, self)
-        self.search_tab = SearchTab(self.notebook, self.db_manager, self)
+        self.search_tab = None
+        self._search_placeholder = ttk.Frame(self.notebook)
         
         # Add tabs to notebook
         self.notebook.add(self.claim_form_tab.frame, text="New/Edit Claim")
-        self.notebook.add(self.search_tab.frame, text="Search Claims")
+        self.notebook.add(self._search_placeholder, text="Search Claims")
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
         
         # Status bar
         self.status_var = tk.StringVar()
@@ -75,6 +85,19 @@ class MainWindow:
         status_bar = ttk.Label(main_frame, textvariable=self.status_var, relief=tk.SUNKEN)
         status_bar.grid(row=2, column=0, sticky="ew", pady=(10, 0))
     
+    def on_tab_changed(self, event=None):
+        """Build the search tab on first selection"""
+        if self.search_tab is None and self.notebook.index('current') == 1:
+            self.get_search_tab()
+    
+    def get_search_tab(self):
+        """Return the search tab, creating it inside its placeholder if needed"""
+        if self.search_tab is None:
+            from gui.search_tab import SearchTab
+            self.search_tab = SearchTab(self._search_placeholder, self.db_manager, self)
+            self.search_tab.frame.pack(fill=tk.BOTH, expand=True)
+        return self.search_tab
+    
     def setup_menu(self):
         """Create the application menu"""
         menubar = tk.Menu(self.root)
@@ -115,15 +138,18 @@ class MainWindow:
     
     def export_all_claims(self):
         """Export all claims to file"""
-        claims = self.db_manager.get_all_claims()
+        claims = self.db_manager.get_all_claims(full_rows=True)
         if claims:
-            self.search_tab.export_claims(claims)
+            self.get_search_tab().export_claims(claims)
         else:
             messagebox.showinfo("Export", "No claims to export.")
     
     def show_statistics(self):
         """Show claim statistics in a popup"""
-        stats = self.db_manager.get_claim_statistics()
+        if self._stats_cache is None or time.monotonic() - self._stats_cache_ts >= STATS_CACHE_TTL:
+            self._stats_cache = self.db_manager.get_claim_statistics()
+            self._stats_cache_ts = time.monotonic()
+        stats = self._stats_cache
         
         # Create statistics window
         stats_window = tk.Toplevel(self.root)
@@ -151,8 +177,8 @@ class MainWindow:
         # Claims by status
         if stats['by_status']:
             ttk.Label(main_frame, text="Claims by Status:", font=('Arial', 12, 'bold')).pack(anchor=tk.W, pady=(0, 5))
-            for status, count in stats['by_status'].items():
-                ttk.Label(main_frame, text=f"  {status}: {count}").pack(anchor=tk.W)
+            status_lines = '\n'.join(f"  {status}: {count}" for status, count in stats['by_status'].items())
+            ttk.Label(main_frame, text=status_lines, justify=tk.LEFT).pack(anchor=tk.W)
         
         # Close button
         ttk.Button(main_frame, text="Close", command=stats_window.destroy).pack(pady=(20, 0))
@@ -175,18 +201,44 @@ class MainWindow:
     def set_status(self, message: str):
         """Update the status bar"""
         self.status_var.set(message)
-        self.root.after(3000, lambda: self.status_var.set("Ready"))
+        
+        # Restart the reset timer so an older message's reset cannot clobber this one
+        if self._status_after_id:
+            self.root.after_cancel(self._status_after_id)
+        self._status_after_id = self.root.after(3000, self._reset_status)
+    
+    def _reset_status(self):
+        """Return the status bar to its idle message"""
+        self._status_after_id = None
+        self.status_var.set("Ready")
     
     def edit_claim(self, claim_id: int):
         """Load a claim for editing"""
-        claim_data = self.db_manager.get_claim_by_id(claim_id)
-        if claim_data:
-            self.notebook.select(0)
-            self.claim_form_tab.load_claim(claim_data)
-        else:
-            messagebox.showerror("Error", "Claim not found.")
+        def on_loaded(claim_data):
+            if claim_data:
+                self.notebook.select(0)
+                self.claim_form_tab.load_claim(claim_data)
+            else:
+                messagebox.showerror("Error", "Claim not found.")
+        
+        # Read the claim on the form's database worker so the Tk thread never waits on disk
+        self.claim_form_tab._run_db(self.db_manager.get_claim_with_parent, claim_id, on_done=on_loaded)
+    
+    def invalidate_stats_cache(self):
+        """Drop cached statistics after a claim is written"""
+        self._stats_cache = None
+    
+    def invalidate_search_cache(self):
+        """Drop cached search results after a claim is written"""
+        if self.search_tab is not None:
+            self.search_tab.invalidate_search_cache()
+    
+    def invalidate_parent_cache(self):
+        """Force the claim form to reload parent claim options"""
+        self.claim_form_tab.invalidate_parent_cache()
     
     def refresh_search(self):
         """Refresh the search results"""
-        if hasattr(self.search_tab, 'perform_search'):
+        # An unbuilt search tab loads fresh results when first shown
+        if self.search_tab is not None and hasattr(self.search_tab, 'perform_search'):
             self.search_tab.perform_search()
@@ -5,12 +5,37 @@ Search and filter tab for insurance claims
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import Dict, List
+from collections import OrderedDict
 import csv
 from datetime import datetime
 
 from gui.components import DatePicker
 from utils.export import ExportManager
 
+# Result rows inserted into the treeview per scroll step
+RESULTS_PAGE_SIZE = 200
+
+# Number of recent filter sets whose results are kept in memory
+SEARCH_CACHE_SIZE = 8
+
+# Bound formatter for rupee amounts, shared by every result row
+_FMT_INR = "₹{:,.2f}".format
+
+# Claim field behind each result column, used for ORDER BY when sorting
+RESULT_COLUMN_KEYS = {
+    'ID': 'id', 'Entry Date': 'entry_date', 'Customer Name': 'customer_name',
+    'Policy Number': 'policy_number', 'Hospital Name': 'hospital_name',
+    'Company': 'company_name', 'Claim Number': 'claim_number', 'Status': 'claim_status',
+    'Type': 'claim_type', 'Claimed Amount': 'claimed_amount', 'Approved Amount': 'approved_amount'
+}
+
+# Treeview tags for statuses that get a highlight colour
+STATUS_TAGS = {
+    'Approved': ('approved',),
+    'Declined': ('declined',),
+    'Settled': ('settled',),
+}
+
 class SearchTab:
     def __init__(self, parent, db_manager, main_window):
         """Initialize the search tab"""
@@ -35,8 +60,24 @@ class SearchTab:
             "Hospital cash", "Health check-up"
         ]
         
+        # Result rows and how many of them are currently in the treeview
+        self._all_rows = []
+        self._rendered_count = 0
+        
+        # Filters behind the current results (None for "show all") and their full rows by id
+        self._last_filters = None
+        self._last_claims = None
+        
+        # Recent search results keyed by filter set, most recently used last
+        self._search_cache = OrderedDict()
+        
+        # Column -> whether its last sort was descending
+        self._sort_state = {}
+        
         self.create_widgets()
-        self.load_all_claims()
+        
+        # Let the tab paint before the first query runs
+        self.parent.after_idle(self.load_all_claims)
     
     def create_widgets(self):
         """Create the search interface"""
@@ -132,14 +173,19 @@ class SearchTab:
             self.tree.heading(col, text=col, command=lambda c=col: self.sort_column(c))
             self.tree.column(col, width=column_widths.get(col, 100), minwidth=80)
         
+        # Configure status tags
+        self.tree.tag_configure('approved', background='#d4edda')
+        self.tree.tag_configure('declined', background='#f8d7da')
+        self.tree.tag_configure('settled', background='#cce5ff')
+        
         # Scrollbars
-        v_scrollbar = ttk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.v_scrollbar = ttk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self.tree.yview)
         h_scrollbar = ttk.Scrollbar(results_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll, xscrollcommand=h_scrollbar.set)
         
         # Pack treeview and scrollbars
         self.tree.pack(side=tk.LEFT, fill="both", expand=True)
-        v_scrollbar.pack(side=tk.RIGHT, fill="y")
+        self.v_scrollbar.pack(side=tk.RIGHT, fill="y")
         h_scrollbar.pack(side=tk.BOTTOM, fill="x")
         
         # Bind double-click to edit
@@ -176,42 +222,28 @@ class SearchTab:
     
     def get_search_filters(self) -> Dict:
         """Get current search filters"""
-        filters = {}
-        
-        if self.search_customer_name.get().strip():
-            filters['customer_name'] = self.search_customer_name.get().strip()
-        
-        if self.search_policy_number.get().strip():
-            filters['policy_number'] = self.search_policy_number.get().strip()
-        
-        if self.search_claim_status.get():
-            filters['claim_status'] = self.search_claim_status.get()
-        
-        if self.search_claim_type.get():
-            filters['claim_type'] = self.search_claim_type.get()
-        
-        if self.search_company.get():
-            filters['company_name'] = self.search_company.get()
-        
-        if self.search_entry_date_from.get_date():
-            filters['entry_date_from'] = self.search_entry_date_from.get_date()
-        
-        if self.search_entry_date_to.get_date():
-            filters['entry_date_to'] = self.search_entry_date_to.get_date()
-        
-        if self.search_admission_date_from.get_date():
-            filters['admission_date_from'] = self.search_admission_date_from.get_date()
-        
-        if self.search_admission_date_to.get_date():
-            filters['admission_date_to'] = self.search_admission_date_to.get_date()
+        # Read each widget once and keep only the non-empty values
+        values = (
+            ('customer_name', self.search_customer_name.get().strip()),
+            ('policy_number', self.search_policy_number.get().strip()),
+            ('claim_status', self.search_claim_status.get()),
+            ('claim_type', self.search_claim_type.get()),
+            ('company_name', self.search_company.get()),
+            ('entry_date_from', self.search_entry_date_from.get_date()),
+            ('entry_date_to', self.search_entry_date_to.get_date()),
+            ('admission_date_from', self.search_admission_date_from.get_date()),
+            ('admission_date_to', self.search_admission_date_to.get_date()),
+        )
         
-        return filters
+        return {key: value for key, value in values if value}
     
     def perform_search(self):
         """Perform search with current filters"""
         try:
             filters = self.get_search_filters()
-            claims = self.db_manager.search_claims(filters)
+            claims = self._cached_search(filters)
+            self._last_filters = filters
+            self._last_claims = None
             self.populate_results(claims)
             
             # Update results count
@@ -221,10 +253,29 @@ class SearchTab:
         except Exception as e:
             messagebox.showerror("Search Error", f"Failed to search claims: {str(e)}")
     
+    def _cached_search(self, filters: Dict) -> List[Dict]:
+        """Run search_claims, reusing results for a recently repeated filter set"""
+        key = frozenset(filters.items())
+        if key in self._search_cache:
+            self._search_cache.move_to_end(key)
+            return self._search_cache[key]
+        
+        claims = self.db_manager.search_claims(filters)
+        self._search_cache[key] = claims
+        if len(self._search_cache) > SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        return claims
+    
+    def invalidate_search_cache(self):
+        """Forget cached search results after claims change"""
+        self._search_cache.clear()
+    
     def load_all_claims(self):
         """Load all claims"""
         try:
             claims = self.db_manager.get_all_claims()
+            self._last_filters = None
+            self._last_claims = None
             self.populate_results(claims)
             self.results_count_var.set(f"Showing all {len(claims)} claim(s)")
         except Exception as e:
@@ -233,50 +284,54 @@ class SearchTab:
     def populate_results(self, claims: List[Dict]):
         """Populate the treeview with search results"""
         # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Add claims to treeview
-        for claim in claims:
-            # Format amounts
-            claimed_amount = f"₹{claim['claimed_amount']:,.2f}" if claim['claimed_amount'] else ""
-            approved_amount = f"₹{claim['approved_amount']:,.2f}" if claim['approved_amount'] else ""
-            
-            # Format entry date
-            entry_date = claim['entry_date']
-            if isinstance(entry_date, str) and len(entry_date) > 10:
-                entry_date = entry_date[:10]  # Take only date part
-            
-            values = (
-                claim['id'],
-                entry_date,
-                claim['customer_name'],
-                claim['policy_number'],
-                claim['hospital_name'],
-                claim['company_name'],
-                claim['claim_number'] or '',
-                claim['claim_status'],
-                claim['claim_type'],
-                claimed_amount,
-                approved_amount
-            )
-            
-            # Add item with tag for styling
-            item_id = self.tree.insert('', 'end', values=values)
-            
-            # Color code based on status
-            if claim['claim_status'] == 'Approved':
-                self.tree.set(item_id, 'Status', claim['claim_status'])
-                self.tree.item(item_id, tags=('approved',))
-            elif claim['claim_status'] == 'Declined':
-                self.tree.item(item_id, tags=('declined',))
-            elif claim['claim_status'] == 'Settled':
-                self.tree.item(item_id, tags=('settled',))
-        
-        # Configure tags
-        self.tree.tag_configure('approved', background='#d4edda')
-        self.tree.tag_configure('declined', background='#f8d7da')
-        self.tree.tag_configure('settled', background='#cce5ff')
+        self.tree.delete(*self.tree.get_children())
+        
+        # Keep the raw rows; each page is formatted only when it is inserted
+        self._all_rows = list(claims)
+        self._rendered_count = 0
+        self._render_next_page()
+    
+    def _format_row(self, claim) -> tuple:
+        """Build the treeview values and tags for one claim"""
+        # Format amounts
+        claimed_amount = _FMT_INR(claim['claimed_amount']) if claim['claimed_amount'] else ""
+        approved_amount = _FMT_INR(claim['approved_amount']) if claim['approved_amount'] else ""
+        
+        # Format entry date
+        entry_date = claim['entry_date']
+        if isinstance(entry_date, str) and len(entry_date) > 10:
+            entry_date = entry_date[:10]  # Take only date part
+        
+        values = (
+            claim['id'],
+            entry_date,
+            claim['customer_name'],
+            claim['policy_number'],
+            claim['hospital_name'],
+            claim['company_name'],
+            claim['claim_number'] or '',
+            claim['claim_status'],
+            claim['claim_type'],
+            claimed_amount,
+            approved_amount
+        )
+        
+        # Color code based on status
+        return values, STATUS_TAGS.get(claim['claim_status'], ())
+    
+    def _render_next_page(self):
+        """Format and append the next page of result rows to the treeview"""
+        end = self._rendered_count + RESULTS_PAGE_SIZE
+        for claim in self._all_rows[self._rendered_count:end]:
+            values, tags = self._format_row(claim)
+            self.tree.insert('', 'end', values=values, tags=tags)
+        self._rendered_count = min(end, len(self._all_rows))
+    
+    def _on_tree_yscroll(self, first, last):
+        """Keep the scrollbar in sync and load more rows near the bottom"""
+        self.v_scrollbar.set(first, last)
+        if float(last) > 0.9 and self._rendered_count < len(self._all_rows):
+            self._render_next_page()
     
     def clear_search(self):
         """Clear all search filters"""
@@ -291,23 +346,19 @@ class SearchTab:
         self.search_admission_date_to.set_date("")
     
     def sort_column(self, col):
-        """Sort treeview by column"""
-        data = [(self.tree.set(child, col), child) for child in self.tree.get_children('')]
+        """Sort results by column, toggling direction on repeated clicks"""
+        desc = not self._sort_state.get(col, True)
+        self._sort_state[col] = desc
         
-        # Determine if sorting by numeric values
-        numeric_cols = ['ID', 'Claimed Amount', 'Approved Amount']
-        if col in numeric_cols:
-            # Sort numerically
-            try:
-                data.sort(key=lambda x: float(str(x[0]).replace('₹', '').replace(',', '')) if x[0] else 0)
-            except ValueError:
-                data.sort()  # Fall back to string sort
-        else:
-            data.sort()
+        # Let SQLite re-run the current result query in the requested order
+        try:
+            claims = self.db_manager.search_claims(
+                self._last_filters or {}, order_by=RESULT_COLUMN_KEYS[col], desc=desc)
+        except Exception as e:
+            messagebox.showerror("Sort Error", f"Failed to sort claims: {str(e)}")
+            return
         
-        # Rearrange items
-        for idx, (val, child) in enumerate(data):
-            self.tree.move(child, '', idx)
+        self.populate_results(claims)
     
     def edit_selected_claim(self, event=None):
         """Edit the selected claim"""
@@ -353,7 +404,7 @@ class SearchTab:
         
         # Populate linked claims
         for claim in linked_claims:
-            amount = f"₹{claim['claimed_amount']:,.2f}" if claim['claimed_amount'] else ""
+            amount = _FMT_INR(claim['claimed_amount']) if claim['claimed_amount'] else ""
             values = (
                 claim['id'],
                 claim['customer_name'],
@@ -387,7 +438,13 @@ class SearchTab:
             try:
                 success = self.db_manager.delete_claim(claim_id)
                 if success:
-                    self.tree.delete(item)
+                    self.main_window.invalidate_parent_cache()
+                    self.main_window.invalidate_stats_cache()
+                    self.invalidate_search_cache()
+                    # The full-row map used by exports still holds the deleted claims
+                    self._last_claims = None
+                    # Linked claims were deleted by the cascade too, so re-run the search
+                    self.perform_search()
                     self.main_window.set_status("Claim deleted successfully")
                     messagebox.showinfo("Success", "Claim deleted successfully.")
                 else:
@@ -437,13 +494,21 @@ class SearchTab:
     
     def get_current_results(self) -> List[Dict]:
         """Get current results as a list of dictionaries"""
+        if self._last_claims is None:
+            # Re-run the last query once for full rows instead of one lookup per row
+            if self._last_filters is None:
+                rows = self.db_manager.get_all_claims(full_rows=True)
+            else:
+                rows = self.db_manager.search_claims(self._last_filters, full_rows=True)
+            self._last_claims = {row['id']: row for row in rows}
+        
         claims = []
-        for item in self.tree.get_children():
-            values = self.tree.item(item)['values']
-            claim_id = values[0]
+        for row in self._all_rows:
+            claim_id = row['id']
             
-            # Get full claim data from database
-            claim = self.db_manager.get_claim_by_id(claim_id)
+            # Keep the on-screen order; fall back to the database on a miss and
+            # skip claims that no longer exist there either
+            claim = self._last_claims.get(claim_id) or self.db_manager.get_claim_by_id(claim_id)
             if claim:
                 claims.append(claim)
         
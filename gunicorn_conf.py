@@ -0,0 +1,19 @@
+"""
+Gunicorn configuration for the Insurance Claim Management web server
+
+Usage: gunicorn -c gunicorn_conf.py web_server:app
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# (2 x CPU) + 1 worker processes, each serving requests on a small thread pool.
+# Requests mostly wait on SQLite and file IO, which release the GIL, so threads
+# overlap them without the monkey-patching a gevent worker would need.
+workers = int(os.environ.get('WEB_CONCURRENCY', (2 * (os.cpu_count() or 1)) + 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Not preloaded: each worker opens its own SQLite connections after the fork
+preload_app = False
@@ -8,6 +8,7 @@ import tkinter as tk
 from tkinter import messagebox
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the current directory to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -18,13 +19,36 @@ from gui.main_window import MainWindow
 def main():
     """Main application entry point"""
     try:
-        # Initialize database
+        # Create the window first so it paints while the database opens
+        root = tk.Tk()
+        root.title("Insurance Claim Management System")
+        loading_label = tk.Label(root, text="Loading…", font=('Arial', 14))
+        loading_label.pack(expand=True, padx=40, pady=40)
+        
+        # Initialize database on a worker thread
         db_manager = DatabaseManager()
-        db_manager.initialize_database()
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(db_manager.initialize_database)
+        executor.shutdown(wait=False)
         
-        # Create and run the main application
-        root = tk.Tk()
-        app = MainWindow(root, db_manager)
+        def start_app():
+            """Build the main window once the database is ready"""
+            if not future.done():
+                root.after(50, start_app)
+                return
+            
+            try:
+                future.result()
+            except Exception as e:
+                messagebox.showerror("Application Error", f"Failed to start application: {str(e)}")
+                root.destroy()
+                return
+            
+            # Create the main application
+            loading_label.destroy()
+            MainWindow(root, db_manager)
+        
+        root.after(50, start_app)
         
         # Configure window close behavior
         def on_closing():
@@ -2,11 +2,26 @@
 Claim data model for Insurance Claim Management System
 """
 
+import operator
 from datetime import datetime
-from typing import Dict, Optional, List
-from dataclasses import dataclass, field
+from typing import Dict, Optional, List, Tuple
+from dataclasses import dataclass
 
-@dataclass
+# Claim-type and status groups used by the per-claim checks below
+_MAIN_TYPES = frozenset(('Cashless', 'Reimbursement'))
+_LINKABLE = frozenset(('Pre-post', 'Hospital cash'))
+_FOLLOWUP = frozenset(('Additional requirement', 'Reconsideration'))
+
+# Keys of Claim.to_dict, in output order, and a getter for the matching attributes
+_DICT_KEYS = (
+    'id', 'entry_date', 'admission_date', 'customer_name', 'policy_number',
+    'hospital_name', 'company_name', 'claim_number', 'claim_status',
+    'claimed_amount', 'approved_amount', 'claim_type', 'remark',
+    'parent_claim_id', 'tpa_name', 'created_at', 'updated_at'
+)
+_get_dict_values = operator.attrgetter(*_DICT_KEYS)
+
+@dataclass(slots=True)
 class Claim:
     """Data model for insurance claim"""
     
@@ -33,8 +48,8 @@ class Claim:
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
     
-    # Linked claims (not stored in DB, populated when needed)
-    linked_claims: List['Claim'] = field(default_factory=list)
+    # Linked claims (not stored in DB, populated when needed; None until then)
+    linked_claims: Optional[List['Claim']] = None
     
     def __post_init__(self):
         """Post-initialization processing"""
@@ -47,29 +62,11 @@ class Claim:
     @classmethod
     def from_dict(cls, data: Dict) -> 'Claim':
         """Create Claim instance from dictionary"""
-        return cls(**{k: v for k, v in data.items() if k in cls.__annotations__})
+        return cls(**{k: v for k, v in data.items() if k in _CLAIM_FIELDS})
     
     def to_dict(self) -> Dict:
         """Convert Claim instance to dictionary"""
-        return {
-            'id': self.id,
-            'entry_date': self.entry_date,
-            'admission_date': self.admission_date,
-            'customer_name': self.customer_name,
-            'policy_number': self.policy_number,
-            'hospital_name': self.hospital_name,
-            'company_name': self.company_name,
-            'claim_number': self.claim_number,
-            'claim_status': self.claim_status,
-            'claimed_amount': self.claimed_amount,
-            'approved_amount': self.approved_amount,
-            'claim_type': self.claim_type,
-            'remark': self.remark,
-            'parent_claim_id': self.parent_claim_id,
-            'tpa_name': self.tpa_name,
-            'created_at': self.created_at,
-            'updated_at': self.updated_at
-        }
+        return dict(zip(_DICT_KEYS, _get_dict_values(self)))
     
     def update_timestamp(self):
         """Update the updated_at timestamp"""
@@ -77,11 +74,11 @@ class Claim:
     
     def is_main_claim(self) -> bool:
         """Check if this is a main claim (can have linked claims)"""
-        return self.claim_type in ['Cashless', 'Reimbursement']
+        return self.claim_type in _MAIN_TYPES
     
     def can_be_linked(self) -> bool:
         """Check if this claim can be linked to a parent claim"""
-        return self.claim_type in ['Pre-post', 'Hospital cash']
+        return self.claim_type in _LINKABLE
     
     def get_display_name(self) -> str:
         """Get a display name for this claim"""
@@ -112,7 +109,7 @@ class Claim:
     
     def needs_follow_up(self) -> bool:
         """Check if the claim needs follow-up"""
-        return self.claim_status in ['Additional requirement', 'Reconsideration']
+        return self.claim_status in _FOLLOWUP
     
     def validate(self) -> List[str]:
         """Validate claim data and return list of errors"""
@@ -131,6 +128,9 @@ class Claim:
                f"policy_number='{self.policy_number}', claim_type='{self.claim_type}', "
                f"status='{self.claim_status}')")
 
+# Field names accepted by Claim.from_dict
+_CLAIM_FIELDS = frozenset(Claim.__annotations__)
+
 class ClaimStatus:
     """Constants for claim statuses"""
     INTIMATION = "Intimation"
@@ -142,23 +142,27 @@ class ClaimStatus:
     ADDITIONAL_REQUIREMENT = "Additional requirement"
     OMBUDSMAN = "Ombudsman"
     
+    _ALL = (
+        INTIMATION, SUBMITTED, APPROVED, DECLINED,
+        RECONSIDERATION, SETTLED, ADDITIONAL_REQUIREMENT, OMBUDSMAN
+    )
+    _ACTIVE = (INTIMATION, SUBMITTED, ADDITIONAL_REQUIREMENT, RECONSIDERATION)
+    _FINAL = (APPROVED, DECLINED, SETTLED, OMBUDSMAN)
+    
     @classmethod
-    def get_all(cls) -> List[str]:
+    def get_all(cls) -> Tuple[str, ...]:
         """Get all status values"""
-        return [
-            cls.INTIMATION, cls.SUBMITTED, cls.APPROVED, cls.DECLINED,
-            cls.RECONSIDERATION, cls.SETTLED, cls.ADDITIONAL_REQUIREMENT, cls.OMBUDSMAN
-        ]
+        return cls._ALL
     
     @classmethod
-    def get_active_statuses(cls) -> List[str]:
+    def get_active_statuses(cls) -> Tuple[str, ...]:
         """Get statuses that indicate active claims"""
-        return [cls.INTIMATION, cls.SUBMITTED, cls.ADDITIONAL_REQUIREMENT, cls.RECONSIDERATION]
+        return cls._ACTIVE
     
     @classmethod
-    def get_final_statuses(cls) -> List[str]:
+    def get_final_statuses(cls) -> Tuple[str, ...]:
         """Get statuses that indicate claim is finalized"""
-        return [cls.APPROVED, cls.DECLINED, cls.SETTLED, cls.OMBUDSMAN]
+        return cls._FINAL
 
 class ClaimType:
     """Constants for claim types"""
@@ -169,23 +173,27 @@ class ClaimType:
     HOSPITAL_CASH = "Hospital cash"
     HEALTH_CHECKUP = "Health check-up"
     
+    _ALL = (
+        CASHLESS, REIMBURSEMENT, PRE_POST,
+        DAY_CARE, HOSPITAL_CASH, HEALTH_CHECKUP
+    )
+    _MAIN = (CASHLESS, REIMBURSEMENT)
+    _LINKABLE = (PRE_POST, HOSPITAL_CASH)
+    
     @classmethod
-    def get_all(cls) -> List[str]:
+    def get_all(cls) -> Tuple[str, ...]:
         """Get all claim type values"""
-        return [
-            cls.CASHLESS, cls.REIMBURSEMENT, cls.PRE_POST,
-            cls.DAY_CARE, cls.HOSPITAL_CASH, cls.HEALTH_CHECKUP
-        ]
+        return cls._ALL
     
     @classmethod
-    def get_main_types(cls) -> List[str]:
+    def get_main_types(cls) -> Tuple[str, ...]:
         """Get main claim types that can have linked claims"""
-        return [cls.CASHLESS, cls.REIMBURSEMENT]
+        return cls._MAIN
     
     @classmethod
-    def get_linkable_types(cls) -> List[str]:
+    def get_linkable_types(cls) -> Tuple[str, ...]:
         """Get claim types that can be linked to main claims"""
-        return [cls.PRE_POST, cls.HOSPITAL_CASH]
+        return cls._LINKABLE
 
 class Company:
     """Constants for insurance companies"""
@@ -199,10 +207,12 @@ class Company:
     ORIENTAL = "ORIENTAL"
     FUTURE_GENERALI = "FUTURE GENERALI"
     
+    _ALL = (
+        NIVA, HDFC, TATA, CARE, NEW_INDIA,
+        NATIONAL, UNITED, ORIENTAL, FUTURE_GENERALI
+    )
+    
     @classmethod
-    def get_all(cls) -> List[str]:
+    def get_all(cls) -> Tuple[str, ...]:
         """Get all company values"""
-        return [
-            cls.NIVA, cls.HDFC, cls.TATA, cls.CARE, cls.NEW_INDIA,
-            cls.NATIONAL, cls.UNITED, cls.ORIENTAL, cls.FUTURE_GENERALI
-        ]
+        return cls._ALL
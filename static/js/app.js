@@ -2,21 +2,46 @@
 let currentEditingId = null;
 let allClaims = [];
 
+// The claims list is served a page at a time; the filters are kept so paging stays within the search
+const CLAIMS_PAGE_SIZE = 100;
+let currentFilters = {};
+let currentOffset = 0;
+
 // Initialize the application
 document.addEventListener('DOMContentLoaded', function() {
     // Set today's date as default for entry date
     document.getElementById('entryDate').value = new Date().toISOString().split('T')[0];
     
-    // Load all claims on page load
-    loadAllClaims();
+    // Fill the company, status and type selects
+    loadEnums();
+    
+    // Load claims, main claims for linking and statistics in one request
+    loadDashboard();
     
     // Setup event listeners
     setupEventListeners();
-    
-    // Load main claims for linking
-    loadMainClaims();
 });
 
+async function loadEnums() {
+    try {
+        const response = await fetch('/api/enums');
+        const enums = await response.json();
+        
+        fillSelectOptions(['companyName', 'searchCompany'], enums.companies);
+        fillSelectOptions(['claimStatus', 'searchStatus'], enums.statuses);
+        fillSelectOptions(['claimType', 'searchType'], enums.types);
+    } catch (error) {
+        showAlert('danger', 'Error loading options: ' + error.message);
+    }
+}
+
+function fillSelectOptions(selectIds, values) {
+    selectIds.forEach(id => {
+        const select = document.getElementById(id);
+        values.forEach(value => select.add(new Option(value, value)));
+    });
+}
+
 function setupEventListeners() {
     // Claim form submission
     document.getElementById('claimForm').addEventListener('submit', handleClaimSubmission);
@@ -101,21 +126,8 @@ async function handleSearch(e) {
         }
     });
     
-    try {
-        const queryString = new URLSearchParams(searchParams).toString();
-        const response = await fetch(`/api/claims?${queryString}`);
-        const result = await response.json();
-        
-        if (result.success) {
-            allClaims = result.claims;
-            displayClaims(result.claims);
-            updateResultsCount(result.claims.length, Object.keys(searchParams).length > 0);
-        } else {
-            showAlert('danger', result.error || 'Search failed');
-        }
-    } catch (error) {
-        showAlert('danger', 'Search error: ' + error.message);
-    }
+    currentFilters = searchParams;
+    await loadClaimsPage(0);
 }
 
 function handleClaimTypeChange() {
@@ -167,14 +179,18 @@ function clearSearch() {
 }
 
 async function loadAllClaims() {
+    currentFilters = {};
+    await loadClaimsPage(0);
+}
+
+async function loadClaimsPage(offset) {
     try {
-        const response = await fetch('/api/claims');
+        const queryString = new URLSearchParams({...currentFilters, limit: CLAIMS_PAGE_SIZE, offset: offset}).toString();
+        const response = await fetch(`/api/claims?${queryString}`);
         const result = await response.json();
         
         if (result.success) {
-            allClaims = result.claims;
-            displayClaims(result.claims);
-            updateResultsCount(result.claims.length, false);
+            showClaimsPage(result);
         } else {
             showAlert('danger', result.error || 'Failed to load claims');
         }
@@ -183,6 +199,48 @@ async function loadAllClaims() {
     }
 }
 
+async function loadDashboard() {
+    try {
+        const response = await fetch('/api/dashboard');
+        const result = await response.json();
+        
+        if (result.success) {
+            currentFilters = {};
+            showClaimsPage(result);
+            populateParentClaimSelect(result.main_claims);
+            displayStatistics(result.statistics);
+        } else {
+            showAlert('danger', result.error || 'Failed to load claims');
+        }
+    } catch (error) {
+        showAlert('danger', 'Error loading claims: ' + error.message);
+    }
+}
+
+function loadPreviousPage() {
+    loadClaimsPage(Math.max(0, currentOffset - CLAIMS_PAGE_SIZE));
+}
+
+function loadNextPage() {
+    loadClaimsPage(currentOffset + CLAIMS_PAGE_SIZE);
+}
+
+function showClaimsPage(result) {
+    allClaims = result.claims;
+    currentOffset = result.offset;
+    displayClaims(result.claims);
+    updateResultsCount(result.claims.length, Object.keys(currentFilters).length > 0, result.total);
+    updatePager(result.offset, result.claims.length, result.total);
+}
+
+function updatePager(offset, count, total) {
+    // Only shown when the results span more than one page
+    document.getElementById('claimsPager').style.display = total > count ? 'flex' : 'none';
+    document.getElementById('pageInfo').textContent = count ? `${offset + 1}-${offset + count} of ${total}` : '';
+    document.getElementById('prevPageBtn').disabled = offset === 0;
+    document.getElementById('nextPageBtn').disabled = offset + count >= total;
+}
+
 async function loadMainClaims() {
     try {
         const response = await fetch('/api/main-claims');
@@ -330,9 +388,11 @@ function formatCurrency(amount) {
     return new Intl.NumberFormat('en-IN').format(amount);
 }
 
-function updateResultsCount(count, isFiltered) {
+function updateResultsCount(count, isFiltered, total = count) {
     const badge = document.getElementById('resultsCount');
-    const text = isFiltered ? `${count} claim(s) found` : `${count} claim(s)`;
+    // The server returns one page of claims; show how many exist in all when there are more
+    const shown = total > count ? `${count} of ${total}` : `${count}`;
+    const text = isFiltered ? `${shown} claim(s) found` : `${shown} claim(s)`;
     badge.textContent = text;
 }
 
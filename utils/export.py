@@ -3,42 +3,205 @@ Export utilities for insurance claim data
 """
 
 import csv
+import functools
+import io
+import itertools
 import os
-from typing import List, Dict
+from collections import defaultdict
+from operator import itemgetter
+from typing import Iterable, Iterator, List, Dict, Tuple
 from datetime import datetime
 
 # Try to import openpyxl for Excel support
 try:
     import openpyxl
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill, Alignment
     from openpyxl.utils import get_column_letter
     EXCEL_AVAILABLE = True
 except ImportError:
     EXCEL_AVAILABLE = False
 
+# Try to import xlsxwriter, the faster engine for single-sheet Excel exports
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# Number formats for the value kinds produced by ExportManager._excel_values
+EXCEL_NUMBER_FORMATS = {
+    'money': '₹#,##0.00',
+    'datetime': 'YYYY-MM-DD HH:MM:SS',
+    'date': 'YYYY-MM-DD',
+}
+
+# Leading data rows inspected when sizing Excel columns; widths are set before
+# any row is written, so only these rows are held in memory for sizing
+WIDTH_SAMPLE_ROWS = 200
+
+# Write buffer for CSV exports; fewer, larger writes for big exports
+CSV_BUFFER_SIZE = 1 << 20
+
+# Rows per text chunk yielded by ExportManager.iter_csv
+CSV_CHUNK_ROWS = 500
+
+# Export columns and their display names
+_EXPORT_COLUMNS = (
+    ('id', 'Claim ID'),
+    ('entry_date', 'Entry Date'),
+    ('admission_date', 'Admission Date'),
+    ('customer_name', 'Customer Name'),
+    ('policy_number', 'Policy Number'),
+    ('hospital_name', 'Hospital Name'),
+    ('company_name', 'Company Name'),
+    ('claim_number', 'Claim Number'),
+    ('claim_status', 'Claim Status'),
+    ('claimed_amount', 'Claimed Amount'),
+    ('approved_amount', 'Approved Amount'),
+    ('claim_type', 'Claim Type'),
+    ('remark', 'Remark'),
+    ('parent_claim_id', 'Parent Claim ID'),
+    ('created_at', 'Created At'),
+    ('updated_at', 'Updated At'),
+)
+_FIELDS = tuple(field_name for field_name, _ in _EXPORT_COLUMNS)
+_HEADERS = tuple(display_name for _, display_name in _EXPORT_COLUMNS)
+_FIELD_TO_COL = {field_name: col_idx for col_idx, field_name in enumerate(_FIELDS, 1)}
+
+# Pulls every export value from a claim in one call; claims missing a column are padded from _EMPTY_ROW
+_FIELD_GETTER = itemgetter(*_FIELDS)
+_EMPTY_ROW = dict.fromkeys(_FIELDS, '')
+
+# Columns that get number or date formatting
+_AMOUNT_COLS = frozenset({'claimed_amount', 'approved_amount'})
+_TS_COLS = frozenset({'created_at', 'updated_at'})
+_DATE_COLS = frozenset({'entry_date', 'admission_date'})
+
+def _column_letter(col_idx: int) -> str:
+    """Get the Excel column letter for a 1-based column index"""
+    letters = ''
+    while col_idx:
+        col_idx, remainder = divmod(col_idx - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+def _column_widths(headers: List[str], sample_rows: List[List[Tuple]]) -> List[int]:
+    """Size each column from its header and a sample of the data, capped at 50"""
+    widths = []
+    for col_idx, header in enumerate(headers):
+        max_length = max(
+            [len(header)] +
+            [len(str(values[col_idx][0] or '')) for values in sample_rows]
+        )
+        widths.append(min(max_length + 2, 50))
+    return widths
+
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO timestamp; repeated values across an export are parsed once"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date(value: str) -> datetime:
+    """Parse a YYYY-MM-DD date; repeated values across an export are parsed once"""
+    return datetime.strptime(value, '%Y-%m-%d')
+
+# Per-column cell handlers. Excel handlers return (value, kind) where kind picks a
+# number format from EXCEL_NUMBER_FORMATS (None for text); CSV handlers return the cell text.
+
+def _excel_text(value) -> Tuple:
+    return (str(value) if value is not None else '', None)
+
+def _excel_amount(value) -> Tuple:
+    # Keep as number for Excel calculations
+    return (float(value), 'money') if value else _excel_text(value)
+
+def _excel_timestamp(value) -> Tuple:
+    if value and isinstance(value, str):
+        try:
+            return (_parse_timestamp(value), 'datetime')
+        except ValueError:
+            pass
+    return _excel_text(value)
+
+def _excel_date(value) -> Tuple:
+    if value:
+        try:
+            return (_parse_date(value), 'date')
+        except (TypeError, ValueError):
+            pass
+    return _excel_text(value)
+
+def _csv_text(value) -> str:
+    return '' if value is None else str(value)
+
+def _csv_amount(value) -> str:
+    return f"{value:.2f}" if value else _csv_text(value)
+
+def _csv_timestamp(value) -> str:
+    if value and isinstance(value, str):
+        try:
+            return _parse_timestamp(value).strftime('%Y-%m-%d %H:%M:%S')
+        except ValueError:
+            pass
+    return _csv_text(value)
+
+# Handler per export column, resolved once instead of branching on the field name per cell
+_EXCEL_HANDLERS = tuple(
+    _excel_amount if f in _AMOUNT_COLS else
+    _excel_timestamp if f in _TS_COLS else
+    _excel_date if f in _DATE_COLS else
+    _excel_text
+    for f in _FIELDS
+)
+
+# The grouped (per-status) Excel export only formats amounts
+_GROUPED_EXCEL_HANDLERS = tuple(_excel_amount if f in _AMOUNT_COLS else _excel_text for f in _FIELDS)
+
+_CSV_HANDLERS = tuple(
+    _csv_amount if f in _AMOUNT_COLS else
+    _csv_timestamp if f in _TS_COLS else
+    _csv_text
+    for f in _FIELDS
+)
+
+# The grouped (per-status) CSV export only formats amounts
+_GROUPED_CSV_HANDLERS = tuple(_csv_amount if f in _AMOUNT_COLS else _csv_text for f in _FIELDS)
+
+def _field_values(claim: Dict) -> Tuple:
+    """Get the export column values of a claim, '' for any column it lacks"""
+    try:
+        return _FIELD_GETTER(claim)
+    except KeyError:
+        return _FIELD_GETTER({**_EMPTY_ROW, **claim})
+
+def _csv_row(claim: Dict, handlers: Tuple = _CSV_HANDLERS) -> List[str]:
+    """Format one claim as a CSV row"""
+    return [handler(value) for handler, value in zip(handlers, _field_values(claim))]
+
+def _write_only_row(worksheet, values: List[Tuple]) -> list:
+    """Turn (value, kind) pairs into a write-only row, wrapping only values that need a number format"""
+    row = []
+    for value, kind in values:
+        if kind:
+            cell = WriteOnlyCell(worksheet, value=value)
+            cell.number_format = EXCEL_NUMBER_FORMATS[kind]
+            row.append(cell)
+        else:
+            row.append(value)
+    return row
+
+def _as_dict(claim) -> Dict:
+    """Accept sqlite3.Row results as well as plain claim dictionaries"""
+    return claim if isinstance(claim, dict) else dict(claim)
+
 class ExportManager:
     """Manager for exporting claim data to various formats"""
     
     def __init__(self):
-        # Define export columns and their display names
-        self.export_columns = [
-            ('id', 'Claim ID'),
-            ('entry_date', 'Entry Date'),
-            ('admission_date', 'Admission Date'),
-            ('customer_name', 'Customer Name'),
-            ('policy_number', 'Policy Number'),
-            ('hospital_name', 'Hospital Name'),
-            ('company_name', 'Company Name'),
-            ('claim_number', 'Claim Number'),
-            ('claim_status', 'Claim Status'),
-            ('claimed_amount', 'Claimed Amount'),
-            ('approved_amount', 'Approved Amount'),
-            ('claim_type', 'Claim Type'),
-            ('remark', 'Remark'),
-            ('parent_claim_id', 'Parent Claim ID'),
-            ('created_at', 'Created At'),
-            ('updated_at', 'Updated At')
-        ]
+        # Export columns and their display names
+        self.export_columns = _EXPORT_COLUMNS
     
     def export_to_csv(self, claims: List[Dict], filename: str) -> bool:
         """
@@ -52,36 +215,14 @@ class ExportManager:
             True if successful, False otherwise
         """
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+            with open(filename, 'w', buffering=CSV_BUFFER_SIZE, newline='', encoding='utf-8') as csvfile:
                 writer = csv.writer(csvfile)
                 
                 # Write headers
-                headers = [display_name for _, display_name in self.export_columns]
-                writer.writerow(headers)
+                writer.writerow(_HEADERS)
                 
                 # Write claim data
-                for claim in claims:
-                    row = []
-                    for field_name, _ in self.export_columns:
-                        value = claim.get(field_name, '')
-                        
-                        # Format specific fields
-                        if field_name in ['claimed_amount', 'approved_amount'] and value:
-                            value = f"{value:.2f}"
-                        elif field_name in ['created_at', 'updated_at'] and value:
-                            try:
-                                # Format timestamp
-                                if isinstance(value, str):
-                                    dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
-                                    value = dt.strftime('%Y-%m-%d %H:%M:%S')
-                            except:
-                                pass
-                        elif value is None:
-                            value = ''
-                        
-                        row.append(str(value))
-                    
-                    writer.writerow(row)
+                writer.writerows(_csv_row(_as_dict(claim)) for claim in claims)
             
             return True
             
@@ -89,10 +230,37 @@ class ExportManager:
             print(f"Error exporting to CSV: {e}")
             return False
     
+    def iter_csv(self, claims: Iterable, chunk_rows: int = CSV_CHUNK_ROWS) -> Iterator[str]:
+        """
+        Yield the export_to_csv output as text chunks, for streaming responses
+        
+        Args:
+            claims: Iterable of claim dictionaries or rows
+            chunk_rows: Number of claim rows per chunk
+            
+        Returns:
+            Iterator of CSV text chunks, the first one starting with the headers
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(_HEADERS)
+        
+        claims = iter(claims)
+        while True:
+            writer.writerows(_csv_row(_as_dict(claim)) for claim in itertools.islice(claims, chunk_rows))
+            chunk = buffer.getvalue()
+            if not chunk:
+                return
+            yield chunk
+            buffer.seek(0)
+            buffer.truncate()
+    
     def export_to_excel(self, claims: List[Dict], filename: str) -> bool:
         """
         Export claims to Excel file
         
+        Uses xlsxwriter when it is installed and falls back to openpyxl.
+        
         Args:
             claims: List of claim dictionaries
             filename: Output filename
@@ -100,90 +268,63 @@ class ExportManager:
         Returns:
             True if successful, False otherwise
         """
-        if not EXCEL_AVAILABLE:
+        if not (EXCEL_AVAILABLE or XLSXWRITER_AVAILABLE):
             raise ImportError("openpyxl library not available. Please install it to export to Excel.")
         
+        if XLSXWRITER_AVAILABLE:
+            return self._export_excel_xlsxwriter(claims, filename)
+        
         try:
-            # Create workbook and worksheet
-            workbook = openpyxl.Workbook()
-            worksheet = workbook.active
-            worksheet.title = "Insurance Claims"
+            headers = list(_HEADERS)
+            value_rows, widths = self._excel_rows_and_widths(claims, headers)
+            
+            # Write-only workbooks stream rows to disk instead of keeping every cell in memory
+            workbook = openpyxl.Workbook(write_only=True)
+            worksheet = workbook.create_sheet("Insurance Claims")
             
             # Header styling
             header_font = Font(bold=True, color="FFFFFF")
             header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
             header_alignment = Alignment(horizontal="center", vertical="center")
             
+            # Column widths must be set before the first row is written
+            for col_idx, width in enumerate(widths, 1):
+                worksheet.column_dimensions[get_column_letter(col_idx)].width = width
+            
             # Write headers
-            headers = [display_name for _, display_name in self.export_columns]
-            for col_idx, header in enumerate(headers, 1):
-                cell = worksheet.cell(row=1, column=col_idx, value=header)
+            header_cells = []
+            for header in headers:
+                cell = WriteOnlyCell(worksheet, value=header)
                 cell.font = header_font
                 cell.fill = header_fill
                 cell.alignment = header_alignment
+                header_cells.append(cell)
+            worksheet.append(header_cells)
             
-            # Write claim data
-            for row_idx, claim in enumerate(claims, 2):
-                for col_idx, (field_name, _) in enumerate(self.export_columns, 1):
-                    value = claim.get(field_name, '')
-                    
-                    # Format specific fields
-                    if field_name in ['claimed_amount', 'approved_amount'] and value:
-                        # Keep as number for Excel calculations
-                        cell = worksheet.cell(row=row_idx, column=col_idx, value=float(value))
-                        cell.number_format = '₹#,##0.00'
-                    elif field_name in ['created_at', 'updated_at'] and value:
-                        try:
-                            # Format timestamp
-                            if isinstance(value, str):
-                                dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
-                                cell = worksheet.cell(row=row_idx, column=col_idx, value=dt)
-                                cell.number_format = 'YYYY-MM-DD HH:MM:SS'
-                            else:
-                                cell = worksheet.cell(row=row_idx, column=col_idx, value=str(value))
-                        except:
-                            cell = worksheet.cell(row=row_idx, column=col_idx, value=str(value))
-                    elif field_name in ['entry_date', 'admission_date'] and value:
-                        try:
-                            # Format dates
-                            dt = datetime.strptime(value, '%Y-%m-%d')
-                            cell = worksheet.cell(row=row_idx, column=col_idx, value=dt)
-                            cell.number_format = 'YYYY-MM-DD'
-                        except:
-                            cell = worksheet.cell(row=row_idx, column=col_idx, value=str(value))
-                    else:
-                        cell = worksheet.cell(row=row_idx, column=col_idx, value=str(value) if value is not None else '')
-            
-            # Auto-adjust column widths
-            for col_idx in range(1, len(headers) + 1):
-                column_letter = get_column_letter(col_idx)
-                column_cells = [worksheet[f"{column_letter}{row}"] for row in range(1, len(claims) + 2)]
-                max_length = max(len(str(cell.value or '')) for cell in column_cells)
-                worksheet.column_dimensions[column_letter].width = min(max_length + 2, 50)
-            
-            # Add summary information
-            summary_row = len(claims) + 3
-            worksheet.cell(row=summary_row, column=1, value="Summary").font = Font(bold=True)
+            # Write claim data, counting rows for the summary
+            row_count = 0
+            for values in value_rows:
+                worksheet.append(_write_only_row(worksheet, values))
+                row_count += 1
             
-            # Total claims
-            worksheet.cell(row=summary_row + 1, column=1, value="Total Claims:")
-            worksheet.cell(row=summary_row + 1, column=2, value=len(claims))
+            # Add summary information after one blank row
+            worksheet.append([])
+            summary_cell = WriteOnlyCell(worksheet, value="Summary")
+            summary_cell.font = Font(bold=True)
+            worksheet.append([summary_cell])
             
-            # Total claimed amount
-            claimed_col = next(i for i, (field, _) in enumerate(self.export_columns, 1) if field == 'claimed_amount')
-            worksheet.cell(row=summary_row + 2, column=1, value="Total Claimed Amount:")
-            worksheet.cell(row=summary_row + 2, column=2, value=f"=SUM({get_column_letter(claimed_col)}2:{get_column_letter(claimed_col)}{len(claims) + 1})")
-            worksheet.cell(row=summary_row + 2, column=2).number_format = '₹#,##0.00'
+            # Total claims
+            worksheet.append(["Total Claims:", row_count])
             
-            # Total approved amount
-            approved_col = next(i for i, (field, _) in enumerate(self.export_columns, 1) if field == 'approved_amount')
-            worksheet.cell(row=summary_row + 3, column=1, value="Total Approved Amount:")
-            worksheet.cell(row=summary_row + 3, column=2, value=f"=SUM({get_column_letter(approved_col)}2:{get_column_letter(approved_col)}{len(claims) + 1})")
-            worksheet.cell(row=summary_row + 3, column=2).number_format = '₹#,##0.00'
+            # Total claimed and approved amounts
+            for label, formula in self._excel_totals(row_count):
+                total_cell = WriteOnlyCell(worksheet, value=formula)
+                total_cell.number_format = EXCEL_NUMBER_FORMATS['money']
+                worksheet.append([label, total_cell])
             
             # Export date
-            worksheet.cell(row=summary_row + 5, column=1, value="Exported on:")
-            worksheet.cell(row=summary_row + 5, column=2, value=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            worksheet.append([])
+            worksheet.append(["Exported on:", datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
             
             # Save workbook
             workbook.save(filename)
@@ -193,6 +334,85 @@ class ExportManager:
             print(f"Error exporting to Excel: {e}")
             return False
     
+    def _excel_rows_and_widths(self, claims: Iterable[Dict], headers: List[str]) -> Tuple[Iterator[List[Tuple]], List[int]]:
+        """Get the lazily built Excel value rows and column widths sized from their leading sample"""
+        value_rows = (self._excel_values(_as_dict(claim)) for claim in claims)
+        sample_rows = list(itertools.islice(value_rows, WIDTH_SAMPLE_ROWS))
+        return itertools.chain(sample_rows, value_rows), _column_widths(headers, sample_rows)
+    
+    def _export_excel_xlsxwriter(self, claims: Iterable[Dict], filename: str) -> bool:
+        """Write the export_to_excel layout with xlsxwriter, flushing each row as it is written"""
+        try:
+            headers = list(_HEADERS)
+            value_rows, widths = self._excel_rows_and_widths(claims, headers)
+            
+            workbook = xlsxwriter.Workbook(filename, {'constant_memory': True})
+            worksheet = workbook.add_worksheet("Insurance Claims")
+            
+            # Formats are created once and shared by every cell
+            header_format = workbook.add_format({
+                'bold': True, 'font_color': 'white', 'bg_color': '#366092',
+                'align': 'center', 'valign': 'vcenter'
+            })
+            bold_format = workbook.add_format({'bold': True})
+            formats = {kind: workbook.add_format({'num_format': number_format})
+                       for kind, number_format in EXCEL_NUMBER_FORMATS.items()}
+            
+            # Cell writer for each value kind
+            writers = {
+                None: worksheet.write_string,
+                'money': worksheet.write_number,
+                'datetime': worksheet.write_datetime,
+                'date': worksheet.write_datetime,
+            }
+            
+            for col_idx, width in enumerate(widths):
+                worksheet.set_column(col_idx, col_idx, width)
+            
+            # Write headers
+            worksheet.write_row(0, 0, headers, header_format)
+            
+            # Write claim data, counting rows for the summary
+            row_count = 0
+            for row_idx, values in enumerate(value_rows, 1):
+                for col_idx, (value, kind) in enumerate(values):
+                    writers[kind](row_idx, col_idx, value, formats.get(kind))
+                row_count = row_idx
+            
+            # Add summary information after one blank row
+            summary_row = row_count + 2
+            worksheet.write_string(summary_row, 0, "Summary", bold_format)
+            worksheet.write_string(summary_row + 1, 0, "Total Claims:")
+            worksheet.write_number(summary_row + 1, 1, row_count)
+            
+            for offset, (label, formula) in enumerate(self._excel_totals(row_count), 2):
+                worksheet.write_string(summary_row + offset, 0, label)
+                worksheet.write_formula(summary_row + offset, 1, formula, formats['money'])
+            
+            # Export date
+            worksheet.write_string(summary_row + 5, 0, "Exported on:")
+            worksheet.write_string(summary_row + 5, 1, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            
+            workbook.close()
+            return True
+            
+        except Exception as e:
+            print(f"Error exporting to Excel: {e}")
+            return False
+    
+    def _excel_values(self, claim: Dict, handlers: Tuple = _EXCEL_HANDLERS) -> List[Tuple]:
+        """Convert one claim to (value, kind) pairs; kind picks the number format, None for text"""
+        return [handler(value) for handler, value in zip(handlers, _field_values(claim))]
+    
+    def _excel_totals(self, row_count: int) -> List[Tuple[str, str]]:
+        """Get the (label, SUM formula) summary rows for the amount columns"""
+        totals = []
+        for field_name, label in (('claimed_amount', "Total Claimed Amount:"),
+                                  ('approved_amount', "Total Approved Amount:")):
+            col_letter = _column_letter(_FIELD_TO_COL[field_name])
+            totals.append((label, f"=SUM({col_letter}2:{col_letter}{row_count + 1})"))
+        return totals
+    
     def export_claims_by_status(self, claims: List[Dict], filename: str, format_type: str = 'excel') -> bool:
         """
         Export claims grouped by status
@@ -206,12 +426,9 @@ class ExportManager:
             True if successful, False otherwise
         """
         # Group claims by status
-        claims_by_status = {}
-        for claim in claims:
-            status = claim.get('claim_status', 'Unknown')
-            if status not in claims_by_status:
-                claims_by_status[status] = []
-            claims_by_status[status].append(claim)
+        claims_by_status = defaultdict(list)
+        for claim in map(_as_dict, claims):
+            claims_by_status[claim.get('claim_status', 'Unknown')].append(claim)
         
         if format_type.lower() == 'excel' and EXCEL_AVAILABLE:
             return self._export_grouped_excel(claims_by_status, filename)
@@ -221,44 +438,37 @@ class ExportManager:
     def _export_grouped_excel(self, claims_by_status: Dict[str, List[Dict]], filename: str) -> bool:
         """Export grouped claims to Excel with multiple sheets"""
         try:
-            workbook = openpyxl.Workbook()
+            workbook = openpyxl.Workbook(write_only=True)
             
-            # Remove default sheet
-            default_sheet = workbook.active
+            # Header styling
+            header_font = Font(bold=True, color="FFFFFF")
+            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
             
             for status, status_claims in claims_by_status.items():
                 # Create sheet for each status
                 worksheet = workbook.create_sheet(title=status[:31])  # Sheet name limit
                 
-                # Header styling
-                header_font = Font(bold=True, color="FFFFFF")
-                header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+                # Fixed column widths, set before any row is written
+                for col_idx in range(1, len(_HEADERS) + 1):
+                    worksheet.column_dimensions[get_column_letter(col_idx)].width = 15
                 
                 # Write headers
-                headers = [display_name for _, display_name in self.export_columns]
-                for col_idx, header in enumerate(headers, 1):
-                    cell = worksheet.cell(row=1, column=col_idx, value=header)
+                header_cells = []
+                for header in _HEADERS:
+                    cell = WriteOnlyCell(worksheet, value=header)
                     cell.font = header_font
                     cell.fill = header_fill
+                    header_cells.append(cell)
+                worksheet.append(header_cells)
                 
                 # Write claim data
-                for row_idx, claim in enumerate(status_claims, 2):
-                    for col_idx, (field_name, _) in enumerate(self.export_columns, 1):
-                        value = claim.get(field_name, '')
-                        if field_name in ['claimed_amount', 'approved_amount'] and value:
-                            cell = worksheet.cell(row=row_idx, column=col_idx, value=float(value))
-                            cell.number_format = '₹#,##0.00'
-                        else:
-                            worksheet.cell(row=row_idx, column=col_idx, value=str(value) if value is not None else '')
-                
-                # Auto-adjust column widths
-                for col_idx in range(1, len(headers) + 1):
-                    column_letter = get_column_letter(col_idx)
-                    worksheet.column_dimensions[column_letter].width = 15
+                for claim in status_claims:
+                    values = self._excel_values(claim, _GROUPED_EXCEL_HANDLERS)
+                    worksheet.append(_write_only_row(worksheet, values))
             
-            # Remove default sheet if it's empty
-            if default_sheet.title == "Sheet" and len(workbook.sheetnames) > 1:
-                workbook.remove(default_sheet)
+            # A workbook needs at least one sheet
+            if not claims_by_status:
+                workbook.create_sheet("Sheet")
             
             workbook.save(filename)
             return True
@@ -270,7 +480,7 @@ class ExportManager:
     def _export_grouped_csv(self, claims_by_status: Dict[str, List[Dict]], filename: str) -> bool:
         """Export grouped claims to CSV with status sections"""
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+            with open(filename, 'w', buffering=CSV_BUFFER_SIZE, newline='', encoding='utf-8') as csvfile:
                 writer = csv.writer(csvfile)
                 
                 # Write summary header
@@ -284,20 +494,10 @@ class ExportManager:
                     writer.writerow([])
                     
                     # Column headers
-                    headers = [display_name for _, display_name in self.export_columns]
-                    writer.writerow(headers)
+                    writer.writerow(_HEADERS)
                     
                     # Claim data
-                    for claim in status_claims:
-                        row = []
-                        for field_name, _ in self.export_columns:
-                            value = claim.get(field_name, '')
-                            if field_name in ['claimed_amount', 'approved_amount'] and value:
-                                value = f"{value:.2f}"
-                            elif value is None:
-                                value = ''
-                            row.append(str(value))
-                        writer.writerow(row)
+                    writer.writerows(_csv_row(claim, _GROUPED_CSV_HANDLERS) for claim in status_claims)
                     
                     writer.writerow([])  # Empty row between status groups
             
@@ -310,6 +510,6 @@ class ExportManager:
     def get_export_formats(self) -> List[str]:
         """Get list of available export formats"""
         formats = ['CSV']
-        if EXCEL_AVAILABLE:
+        if EXCEL_AVAILABLE or XLSXWRITER_AVAILABLE:
             formats.append('Excel')
         return formats
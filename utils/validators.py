@@ -2,31 +2,72 @@
 Validation utilities for insurance claim data
 """
 
+import functools
 import re
-from datetime import datetime
-from typing import Dict, List
+from datetime import date
+from typing import Dict, List, Optional
+
+# Letters, spaces, periods, commas, apostrophes, hyphens
+_NAME_RE = re.compile(r"[a-zA-Z\s\.\,\'\-]+")
+
+# Alphanumeric characters, hyphens, underscores
+_POLICY_RE = re.compile(r"[a-zA-Z0-9\-\_]+")
+
+# YYYY-MM-DD shape, checked before parsing so malformed input skips the exception path
+_DATE_SHAPE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_date(date_str: str) -> Optional[date]:
+    """Parse a YYYY-MM-DD string, returning None when it is not a valid date"""
+    if not _DATE_SHAPE.fullmatch(date_str):
+        return None
+    try:
+        return date.fromisoformat(date_str)
+    except ValueError:
+        return None
+
+# Valid company names
+_VALID_COMPANIES = frozenset({
+    "NIVA", "HDFC", "TATA", "CARE", "NEW INDIA", 
+    "NATIONAL", "UNITED", "ORIENTAL", "FUTURE GENERALI"
+})
+
+# Valid claim statuses
+_VALID_STATUSES = frozenset({
+    "Intimation", "Submitted", "Approved", "Declined", 
+    "Reconsideration", "Settled", "Additional requirement", "Ombudsman"
+})
+
+# Valid claim types
+_VALID_CLAIM_TYPES = frozenset({
+    "Cashless", "Reimbursement", "Pre-post", "Day care", 
+    "Hospital cash", "Health check-up"
+})
+
+# Required fields and their labels
+_REQUIRED_FIELDS = (
+    ('entry_date', 'Entry Date'),
+    ('admission_date', 'Date of Admission'),
+    ('customer_name', 'Customer Name'),
+    ('policy_number', 'Policy Number'),
+    ('hospital_name', 'Hospital Name'),
+    ('company_name', 'Company Name'),
+    ('claim_status', 'Claim Status'),
+    ('claim_type', 'Claim Type'),
+)
+
+# Error messages listing the valid options, built once
+_COMPANY_ERROR = f"Company Name must be one of: {', '.join(sorted(_VALID_COMPANIES))}"
+_STATUS_ERROR = f"Claim Status must be one of: {', '.join(sorted(_VALID_STATUSES))}"
+_CLAIM_TYPE_ERROR = f"Claim Type must be one of: {', '.join(sorted(_VALID_CLAIM_TYPES))}"
 
 class ClaimValidator:
     """Validator for insurance claim data"""
     
     def __init__(self):
-        # Valid company names
-        self.valid_companies = {
-            "NIVA", "HDFC", "TATA", "CARE", "NEW INDIA", 
-            "NATIONAL", "UNITED", "ORIENTAL", "FUTURE GENERALI"
-        }
-        
-        # Valid claim statuses
-        self.valid_statuses = {
-            "Intimation", "Submitted", "Approved", "Declined", 
-            "Reconsideration", "Settled", "Additional requirement", "Ombudsman"
-        }
-        
-        # Valid claim types
-        self.valid_claim_types = {
-            "Cashless", "Reimbursement", "Pre-post", "Day care", 
-            "Hospital cash", "Health check-up"
-        }
+        self.valid_companies = _VALID_COMPANIES
+        self.valid_statuses = _VALID_STATUSES
+        self.valid_claim_types = _VALID_CLAIM_TYPES
     
     def validate_claim(self, claim_data: Dict) -> List[str]:
         """
@@ -40,20 +81,11 @@ class ClaimValidator:
         """
         errors = []
         
-        # Required field validation
-        required_fields = [
-            ('entry_date', 'Entry Date'),
-            ('admission_date', 'Date of Admission'),
-            ('customer_name', 'Customer Name'),
-            ('policy_number', 'Policy Number'),
-            ('hospital_name', 'Hospital Name'),
-            ('company_name', 'Company Name'),
-            ('claim_status', 'Claim Status'),
-            ('claim_type', 'Claim Type')
-        ]
-        
-        for field, label in required_fields:
-            if not claim_data.get(field) or str(claim_data.get(field)).strip() == '':
+        # Required field validation; strings are checked directly, other values via str()
+        get = claim_data.get
+        for field, label in _REQUIRED_FIELDS:
+            value = get(field)
+            if not value or not (value.strip() if isinstance(value, str) else str(value).strip()):
                 errors.append(f"{label} is required")
         
         # Date validation
@@ -65,19 +97,17 @@ class ClaimValidator:
             if not self.validate_date(claim_data['admission_date']):
                 errors.append("Date of Admission must be in valid date format (YYYY-MM-DD)")
         
-        # Date logic validation
-        if claim_data.get('entry_date') and claim_data.get('admission_date'):
-            try:
-                entry_date = datetime.strptime(claim_data['entry_date'], '%Y-%m-%d')
-                admission_date = datetime.strptime(claim_data['admission_date'], '%Y-%m-%d')
-                
-                # Entry date should not be before admission date (typically)
-                # This is a business rule that can be adjusted
-                if entry_date < admission_date:
-                    errors.append("Entry Date should not be before Date of Admission")
-                    
-            except ValueError:
-                pass  # Date format errors already caught above
+        # Date logic validation; identical dates are always in order
+        entry_str, admission_str = get('entry_date'), get('admission_date')
+        if entry_str and admission_str and entry_str != admission_str:
+            entry_date = _parse_iso_date(entry_str)
+            admission_date = _parse_iso_date(admission_str)
+            
+            # Entry date should not be before admission date (typically)
+            # This is a business rule that can be adjusted
+            # Date format errors already caught above
+            if entry_date and admission_date and entry_date < admission_date:
+                errors.append("Entry Date should not be before Date of Admission")
         
         # Customer name validation
         if claim_data.get('customer_name'):
@@ -97,17 +127,17 @@ class ClaimValidator:
         # Company name validation
         if claim_data.get('company_name'):
             if claim_data['company_name'] not in self.valid_companies:
-                errors.append(f"Company Name must be one of: {', '.join(sorted(self.valid_companies))}")
+                errors.append(_COMPANY_ERROR)
         
         # Claim status validation
         if claim_data.get('claim_status'):
             if claim_data['claim_status'] not in self.valid_statuses:
-                errors.append(f"Claim Status must be one of: {', '.join(sorted(self.valid_statuses))}")
+                errors.append(_STATUS_ERROR)
         
         # Claim type validation
         if claim_data.get('claim_type'):
             if claim_data['claim_type'] not in self.valid_claim_types:
-                errors.append(f"Claim Type must be one of: {', '.join(sorted(self.valid_claim_types))}")
+                errors.append(_CLAIM_TYPE_ERROR)
         
         # Amount validation
         if claim_data.get('claimed_amount') is not None:
@@ -141,29 +171,21 @@ class ClaimValidator:
         if not date_str:
             return False
         
-        try:
-            datetime.strptime(date_str, '%Y-%m-%d')
-            return True
-        except ValueError:
-            return False
+        return _parse_iso_date(date_str) is not None
     
     def validate_customer_name(self, name: str) -> bool:
         """Validate customer name"""
         if not name or len(name.strip()) < 2:
             return False
         
-        # Allow letters, spaces, periods, commas, apostrophes, hyphens
-        pattern = r"^[a-zA-Z\s\.\,\'\-]+$"
-        return bool(re.match(pattern, name.strip()))
+        return bool(_NAME_RE.fullmatch(name.strip()))
     
     def validate_policy_number(self, policy_number: str) -> bool:
         """Validate policy number"""
         if not policy_number or len(policy_number.strip()) < 3:
             return False
         
-        # Allow alphanumeric characters, hyphens, underscores
-        pattern = r"^[a-zA-Z0-9\-\_]+$"
-        return bool(re.match(pattern, policy_number.strip()))
+        return bool(_POLICY_RE.fullmatch(policy_number.strip()))
     
     def validate_amount(self, amount) -> bool:
         """Validate monetary amount"""
@@ -195,31 +217,31 @@ class ClaimValidator:
         
         # Date range logic validation
         if filters.get('entry_date_from') and filters.get('entry_date_to'):
-            try:
-                date_from = datetime.strptime(filters['entry_date_from'], '%Y-%m-%d')
-                date_to = datetime.strptime(filters['entry_date_to'], '%Y-%m-%d')
-                if date_from > date_to:
-                    errors.append("Entry Date From cannot be after Entry Date To")
-            except ValueError:
-                pass
+            date_from = _parse_iso_date(filters['entry_date_from'])
+            date_to = _parse_iso_date(filters['entry_date_to'])
+            if date_from and date_to and date_from > date_to:
+                errors.append("Entry Date From cannot be after Entry Date To")
         
         if filters.get('admission_date_from') and filters.get('admission_date_to'):
-            try:
-                date_from = datetime.strptime(filters['admission_date_from'], '%Y-%m-%d')
-                date_to = datetime.strptime(filters['admission_date_to'], '%Y-%m-%d')
-                if date_from > date_to:
-                    errors.append("Admission Date From cannot be after Admission Date To")
-            except ValueError:
-                pass
-        
-        # Dropdown field validation
-        if filters.get('company_name') and filters['company_name'] not in self.valid_companies:
+            date_from = _parse_iso_date(filters['admission_date_from'])
+            date_to = _parse_iso_date(filters['admission_date_to'])
+            if date_from and date_to and date_from > date_to:
+                errors.append("Admission Date From cannot be after Admission Date To")
+        
+        # Dropdown field validation (single value or a list of values)
+        if filters.get('company_name') and not self._values_in(filters['company_name'], self.valid_companies):
             errors.append("Invalid company name in filter")
         
-        if filters.get('claim_status') and filters['claim_status'] not in self.valid_statuses:
+        if filters.get('claim_status') and not self._values_in(filters['claim_status'], self.valid_statuses):
             errors.append("Invalid claim status in filter")
         
-        if filters.get('claim_type') and filters['claim_type'] not in self.valid_claim_types:
+        if filters.get('claim_type') and not self._values_in(filters['claim_type'], self.valid_claim_types):
             errors.append("Invalid claim type in filter")
         
         return errors
+    
+    def _values_in(self, value, valid_values: set) -> bool:
+        """Check a filter value, or every item of a list/tuple filter value, against valid options"""
+        if isinstance(value, (list, tuple)):
+            return all(item in valid_values for item in value)
+        return value in valid_values
\ No newline at end of file
@@ -4,17 +4,41 @@ Web-based Insurance Claim Management System
 Flask server to provide web interface for the desktop application
 """
 
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, Response, render_template, request, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import BadRequest
+import gzip
+import hashlib
+import itertools
 import json
+import orjson
 import os
+import zlib
 from datetime import datetime
 from database import DatabaseManager
 from utils.export import ExportManager
-import tempfile
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson, which is much faster on large claim lists"""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        # Also used by request.json; orjson's decode error is a ValueError, so bad bodies still get a 400
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs) -> Response:
+        # Same arguments as jsonify; the body is passed on as bytes without decoding it first
+        obj = args[0] if len(args) == 1 else (args or kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=self.default), mimetype=self.mimetype)
 
 app = Flask(__name__)
 app.secret_key = 'insurance_claim_management_secret_key'
 
+# Returned dicts and request bodies go through app.json, so handlers get orjson without calling it themselves
+app.json = OrjsonProvider(app)
+
 # Initialize database
 db_manager = DatabaseManager()
 db_manager.initialize_database()
@@ -26,72 +50,192 @@ COMPANIES = ["NIVA", "HDFC", "TATA", "CARE", "NEW INDIA", "NATIONAL", "UNITED",
 CLAIM_STATUSES = ["Intimation", "Submitted", "Approved", "Declined", "Reconsideration", "Settled", "Additional requirement", "Ombudsman"]
 CLAIM_TYPES = ["Cashless", "Reimbursement", "Pre-post", "Day care", "Hospital cash", "Health check-up"]
 
+# Option lists served by /api/enums, encoded once since they never change while running
+ENUMS_BODY = json.dumps({'companies': COMPANIES, 'statuses': CLAIM_STATUSES, 'types': CLAIM_TYPES})
+ENUMS_CACHE_CONTROL = 'public, max-age=86400, immutable'
+ENUMS_ETAG = hashlib.sha1(ENUMS_BODY.encode('utf-8')).hexdigest()
+
+# Response types gzipped for clients that accept it, and the size below which it is not worth it
+COMPRESS_MIMETYPES = frozenset({'application/json', 'text/csv'})
+COMPRESS_LEVEL = 5
+COMPRESS_MIN_SIZE = 1024
+
+# Rendered pages that only depend on constant data
+_page_cache = {}
+
+# Query parameters accepted as claim search filters
+CLAIM_FILTER_KEYS = ('customer_name', 'policy_number', 'company_name', 'claim_status', 'claim_type',
+                     'entry_date_from', 'entry_date_to')
+
+# Query parameters accepted as parent-claim filters
+MAIN_CLAIM_FILTER_KEYS = ('customer_name', 'policy_number', 'admission_date_from', 'admission_date_to')
+
+# Fields a new claim must have non-empty values for
+REQUIRED_CLAIM_FIELDS = frozenset({'entry_date', 'admission_date', 'customer_name', 'policy_number',
+                                   'hospital_name', 'company_name', 'claim_status', 'claim_type'})
+
+# Date fields stored as canonical YYYY-MM-DD strings, so date range filters compare correctly
+DATE_FIELDS = ('entry_date', 'admission_date')
+
+# Amount fields converted to float before they are stored
+AMOUNT_FIELDS = ('claimed_amount', 'approved_amount')
+
+# Claims returned per /api/claims request when no limit is given, and the largest limit allowed
+DEFAULT_CLAIMS_LIMIT = 100
+MAX_CLAIMS_LIMIT = 1000
+
+def normalize_dates(data: dict):
+    """Rewrite submitted date fields as YYYY-MM-DD, raising BadRequest for an invalid date"""
+    for field in DATE_FIELDS:
+        value = data.get(field)
+        if value:
+            try:
+                data[field] = datetime.fromisoformat(value).date().isoformat()
+            except (TypeError, ValueError):
+                raise BadRequest(f'{field.replace("_", " ").title()} must be a valid date (YYYY-MM-DD)')
+
+def coerce_amounts(data: dict):
+    """Convert submitted amount fields to float, raising BadRequest for a non-numeric amount"""
+    for field in AMOUNT_FIELDS:
+        value = data.get(field)
+        if value not in (None, ''):
+            try:
+                data[field] = float(value)
+            except (TypeError, ValueError):
+                raise BadRequest(f'{field.replace("_", " ").title()} must be a number')
+
+@app.errorhandler(BadRequest)
+def handle_bad_request(error):
+    """Report invalid request data in the same JSON shape as other API errors"""
+    return {
+        'success': False,
+        'error': error.description
+    }, 400
+
+def claim_etag(claim: dict, linked_claims=None) -> str:
+    """Version tag for a claim response; changes whenever the claim or a linked claim is updated"""
+    rows = [claim] + (linked_claims or [])
+    version = '|'.join(f"{row['id']}:{row['updated_at']}" for row in rows)
+    return hashlib.sha1(version.encode('utf-8')).hexdigest()
+
+def page_args() -> tuple:
+    """Read limit and offset query parameters, raising BadRequest for invalid values"""
+    try:
+        limit = int(request.args.get('limit', DEFAULT_CLAIMS_LIMIT))
+        offset = int(request.args.get('offset', 0))
+    except ValueError:
+        raise BadRequest('limit and offset must be whole numbers')
+    if limit < 1 or offset < 0:
+        raise BadRequest('limit must be positive and offset cannot be negative')
+    return min(limit, MAX_CLAIMS_LIMIT), offset
+
+def rows_to_dicts(rows) -> list:
+    """Convert sqlite3.Row query results into JSON-serializable dictionaries"""
+    return [dict(row) for row in rows]
+
+def _gzip_stream(chunks):
+    """Gzip a streamed response body chunk by chunk"""
+    compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+@app.after_request
+def compress_response(response):
+    """Gzip JSON and CSV responses, including the streamed CSV export"""
+    if response.mimetype not in COMPRESS_MIMETYPES:
+        return response
+    response.vary.add('Accept-Encoding')
+    if ('gzip' not in request.headers.get('Accept-Encoding', '').lower()
+            or 'Content-Encoding' in response.headers
+            or not 200 <= response.status_code < 300):
+        return response
+    
+    if response.is_streamed:
+        response.response = _gzip_stream(response.response)
+        response.headers.pop('Content-Length', None)
+    else:
+        body = response.get_data()
+        if len(body) < COMPRESS_MIN_SIZE:
+            return response
+        response.set_data(gzip.compress(body, COMPRESS_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    return response
+
 @app.route('/')
 def index():
     """Main page"""
-    return render_template('index.html', 
-                         companies=COMPANIES, 
-                         statuses=CLAIM_STATUSES, 
-                         types=CLAIM_TYPES)
+    # The page has no per-request content (option lists come from /api/enums), so it is rendered once per process
+    if _page_cache.get('index') is None:
+        _page_cache['index'] = render_template('index.html')
+    return _page_cache['index']
+
+@app.route('/api/enums', methods=['GET'])
+def get_enums():
+    """Get the company, status and claim type option lists"""
+    response = app.response_class(ENUMS_BODY, mimetype='application/json',
+                                  headers={'Cache-Control': ENUMS_CACHE_CONTROL})
+    response.set_etag(ENUMS_ETAG)
+    return response.make_conditional(request)
 
 @app.route('/api/claims', methods=['GET'])
 def get_claims():
-    """Get all claims or search claims"""
-    filters = {}
-    
+    """Get one page of all claims or of matching claims"""
     # Extract search filters from query parameters
-    if request.args.get('customer_name'):
-        filters['customer_name'] = request.args.get('customer_name')
-    if request.args.get('policy_number'):
-        filters['policy_number'] = request.args.get('policy_number')
-    if request.args.get('company_name'):
-        filters['company_name'] = request.args.get('company_name')
-    if request.args.get('claim_status'):
-        filters['claim_status'] = request.args.get('claim_status')
-    if request.args.get('claim_type'):
-        filters['claim_type'] = request.args.get('claim_type')
-    if request.args.get('entry_date_from'):
-        filters['entry_date_from'] = request.args.get('entry_date_from')
-    if request.args.get('entry_date_to'):
-        filters['entry_date_to'] = request.args.get('entry_date_to')
+    args = request.args
+    filters = {key: value for key in CLAIM_FILTER_KEYS if (value := args.get(key))}
+    limit, offset = page_args()
     
     try:
-        if filters:
-            claims = db_manager.search_claims(filters)
+        claims = db_manager.search_claims(filters, limit=limit, offset=offset)
+        
+        # A short first page already holds every match, so the count query is skipped
+        if offset == 0 and len(claims) < limit:
+            total = len(claims)
         else:
-            claims = db_manager.get_all_claims()
+            total = db_manager.count_claims(filters)
         
-        return jsonify({
+        return {
             'success': True,
-            'claims': claims,
-            'total': len(claims)
-        })
+            'claims': rows_to_dicts(claims),
+            'total': total,
+            'limit': limit,
+            'offset': offset
+        }
     except Exception as e:
-        return jsonify({
+        return {
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500
 
 @app.route('/api/claims/<int:claim_id>', methods=['GET'])
 def get_claim(claim_id):
-    """Get a specific claim"""
+    """Get a specific claim, with its linked claims when ?include=linked is passed"""
     try:
-        claim = db_manager.get_claim_by_id(claim_id)
+        payload = {'success': True}
+        if request.args.get('include') == 'linked':
+            claim, payload['linked_claims'] = db_manager.get_claim_with_linked(claim_id)
+        else:
+            claim = db_manager.get_claim_by_id(claim_id)
+        
         if claim:
-            return jsonify({
-                'success': True,
-                'claim': claim
-            })
+            payload['claim'] = claim
+            # Weak tag, since the body may be sent gzipped; unchanged claims get an empty 304
+            response = app.json.response(payload)
+            response.set_etag(claim_etag(claim, payload.get('linked_claims')), weak=True)
+            return response.make_conditional(request)
         else:
-            return jsonify({
+            return {
                 'success': False,
                 'error': 'Claim not found'
-            }), 404
+            }, 404
     except Exception as e:
-        return jsonify({
+        return {
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500
 
 @app.route('/api/claims', methods=['POST'])
 def create_claim():
@@ -100,35 +244,32 @@ def create_claim():
         data = request.json
         
         # Validate required fields
-        required_fields = ['entry_date', 'admission_date', 'customer_name', 'policy_number', 
-                          'hospital_name', 'company_name', 'claim_status', 'claim_type']
-        
-        for field in required_fields:
-            if not data.get(field):
-                return jsonify({
-                    'success': False,
-                    'error': f'{field.replace("_", " ").title()} is required'
-                }), 400
+        missing = REQUIRED_CLAIM_FIELDS.difference(field for field, value in (data or {}).items() if value)
+        if missing:
+            labels = ', '.join(field.replace("_", " ").title() for field in sorted(missing))
+            return {
+                'success': False,
+                'error': f'{labels} {"is" if len(missing) == 1 else "are"} required'
+            }, 400
         
-        # Convert amounts to float if provided
-        if data.get('claimed_amount'):
-            data['claimed_amount'] = float(data['claimed_amount'])
-        if data.get('approved_amount'):
-            data['approved_amount'] = float(data['approved_amount'])
+        normalize_dates(data)
+        coerce_amounts(data)
         
         claim_id = db_manager.insert_claim(data)
         
-        return jsonify({
+        return {
             'success': True,
             'claim_id': claim_id,
             'message': 'Claim created successfully'
-        })
+        }
         
+    except BadRequest:
+        raise
     except Exception as e:
-        return jsonify({
+        return {
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500
 
 @app.route('/api/claims/<int:claim_id>', methods=['PUT'])
 def update_claim(claim_id):
@@ -136,30 +277,29 @@ def update_claim(claim_id):
     try:
         data = request.json
         
-        # Convert amounts to float if provided
-        if data.get('claimed_amount'):
-            data['claimed_amount'] = float(data['claimed_amount'])
-        if data.get('approved_amount'):
-            data['approved_amount'] = float(data['approved_amount'])
+        normalize_dates(data)
+        coerce_amounts(data)
         
         success = db_manager.update_claim(claim_id, data)
         
         if success:
-            return jsonify({
+            return {
                 'success': True,
                 'message': 'Claim updated successfully'
-            })
+            }
         else:
-            return jsonify({
+            return {
                 'success': False,
                 'error': 'Claim not found or update failed'
-            }), 404
+            }, 404
             
+    except BadRequest:
+        raise
     except Exception as e:
-        return jsonify({
+        return {
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500
 
 @app.route('/api/claims/<int:claim_id>', methods=['DELETE'])
 def delete_claim(claim_id):
@@ -168,134 +308,124 @@ def delete_claim(claim_id):
         success = db_manager.delete_claim(claim_id)
         
         if success:
-            return jsonify({
+            return {
                 'success': True,
                 'message': 'Claim deleted successfully'
-            })
+            }
         else:
-            return jsonify({
+            return {
                 'success': False,
                 'error': 'Claim not found or delete failed'
-            }), 404
+            }, 404
             
     except Exception as e:
-        return jsonify({
+        return {
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500
 
 @app.route('/api/claims/<int:claim_id>/linked', methods=['GET'])
 def get_linked_claims(claim_id):
     """Get claims linked to a parent claim"""
     try:
         linked_claims = db_manager.get_linked_claims(claim_id)
-        return jsonify({
+        return {
             'success': True,
-            'linked_claims': linked_claims
-        })
+            'linked_claims': rows_to_dicts(linked_claims)
+        }
     except Exception as e:
-        return jsonify({
+        return {
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500
 
 @app.route('/api/main-claims', methods=['GET'])
 def get_main_claims():
     """Get main claims that can be used as parent claims, with optional filtering"""
     try:
         # Get filter parameters
-        customer_name = request.args.get('customer_name', '').strip()
-        policy_number = request.args.get('policy_number', '').strip()
-        admission_date_from = request.args.get('admission_date_from', '').strip()
-        admission_date_to = request.args.get('admission_date_to', '').strip()
+        args = request.args
+        filters = {key: value for key in MAIN_CLAIM_FILTER_KEYS if (value := args.get(key, '').strip())}
         
-        if customer_name or policy_number or admission_date_from or admission_date_to:
+        if filters:
             # Use filtered search for main claims
-            filters = {}
-            if customer_name:
-                filters['customer_name'] = customer_name
-            if policy_number:
-                filters['policy_number'] = policy_number
-            if admission_date_from:
-                filters['admission_date_from'] = admission_date_from
-            if admission_date_to:
-                filters['admission_date_to'] = admission_date_to
-            
             main_claims = db_manager.get_filtered_main_claims(filters)
         else:
             # Get all main claims
             main_claims = db_manager.get_main_claims()
             
-        return jsonify({
+        return {
             'success': True,
-            'main_claims': main_claims
-        })
+            'main_claims': rows_to_dicts(main_claims)
+        }
     except Exception as e:
-        return jsonify({
+        return {
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500
+
+@app.route('/api/dashboard', methods=['GET'])
+def get_dashboard():
+    """Get claims, main claims and statistics for the initial page load in one request"""
+    try:
+        bundle = db_manager.get_dashboard_bundle(claims_limit=DEFAULT_CLAIMS_LIMIT)
+        return {
+            'success': True,
+            'claims': rows_to_dicts(bundle['claims']),
+            'total': bundle['statistics']['total_claims'],
+            'limit': DEFAULT_CLAIMS_LIMIT,
+            'offset': 0,
+            'main_claims': rows_to_dicts(bundle['main_claims']),
+            'statistics': bundle['statistics']
+        }
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }, 500
 
 @app.route('/api/statistics', methods=['GET'])
 def get_statistics():
     """Get claim statistics"""
     try:
         stats = db_manager.get_claim_statistics()
-        return jsonify({
+        return {
             'success': True,
             'statistics': stats
-        })
+        }
     except Exception as e:
-        return jsonify({
+        return {
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500
 
 @app.route('/api/export/csv', methods=['POST'])
 def export_csv():
-    """Export claims to CSV"""
+    """Export claims to CSV, streamed to the client as rows are read"""
     try:
         filters = request.json or {}
+        claims = db_manager.iter_claims(filters, full_rows=True)
         
-        if filters:
-            claims = db_manager.search_claims(filters)
-        else:
-            claims = db_manager.get_all_claims()
-        
-        if not claims:
-            return jsonify({
+        # Read the first row up front so an empty export can still be reported as an error
+        first_claim = next(claims, None)
+        if first_claim is None:
+            return {
                 'success': False,
                 'error': 'No claims to export'
-            }), 400
+            }, 400
         
-        # Create temporary file
-        temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv')
-        filename = temp_file.name
-        temp_file.close()
-        
-        # Export to CSV
-        success = export_manager.export_to_csv(claims, filename)
-        
-        if success:
-            return send_file(filename, 
-                           as_attachment=True, 
-                           download_name=f'insurance_claims_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv',
-                           mimetype='text/csv')
-        else:
-            return jsonify({
-                'success': False,
-                'error': 'Export failed'
-            }), 500
+        chunks = export_manager.iter_csv(itertools.chain([first_claim], claims))
+        filename = f'insurance_claims_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+        return Response(stream_with_context(chunks),
+                        mimetype='text/csv',
+                        headers={'Content-Disposition': f'attachment; filename={filename}'})
             
     except Exception as e:
-        return jsonify({
+        return {
             'success': False,
             'error': str(e)
-        }), 500
-    finally:
-        # Clean up temp file
-        if 'filename' in locals() and os.path.exists(filename):
-            os.unlink(filename)
+        }, 500
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file